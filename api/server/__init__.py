@@ -5,6 +5,7 @@ from typing import Dict, Literal, TypedDict, cast
 
 from spots_cli.bootstrap import Container
 from spots_cli.clients import SecretsManager
+from spots_cli.core.pattern_matcher import TOPIC_SUFFIX
 from spots_cli.models import (
     SongNotFound,
     YouTubeQuotaExceeded,
@@ -162,20 +163,28 @@ def query(action: str):
                     best_match = youtube_result.result[0]
 
                 else:
-                    for result in youtube_result.result:
-                        # clean uploader and title first
-                        cleaned = bootstrapper.core.extractor.extract_artist_and_title(
-                            video_info=result, metadata=metadata
-                        )
-                        result.full_title = cleaned
-
-                        tracks_match = bootstrapper.core.matcher.match_tracks(
-                            video_info=result, metadata=metadata
-                        )
-
-                        if tracks_match:
-                            best_match = result
-                            break
+                    candidates = bootstrapper.core.matcher.prefilter(
+                        search_results=youtube_result.result, metadata=metadata
+                    )
+
+                    # extraction strips the suffix of topic channels
+                    topics = [
+                        (candidate.uploader or "").endswith(TOPIC_SUFFIX)
+                        for candidate in candidates
+                    ]
+
+                    # clean uploader and title first
+                    extracted = bootstrapper.core.extractor.extract_many(
+                        candidates=candidates, metadata=metadata
+                    )
+                    for result, artist_and_title in zip(candidates, extracted):
+                        result.full_title = artist_and_title
+
+                    scores = bootstrapper.core.matcher.score_batch(
+                        metadata=metadata, candidates=candidates, topics=topics
+                    )
+                    if scores.best is not None:
+                        best_match = candidates[scores.best]
 
             if not best_match:
                 return jsonify({"message": f"{search_title} not available"}), 500
@@ -26,22 +26,32 @@ def download_saved_tracks():
 
     exceptions = []
 
-    for index, track in enumerate(
-        zip(saved_tracks.provider_metadata, saved_tracks.youtube_metadata)
-    ):
-        logger.info(
-            f"Downloading track {index + 1}/{len(saved_tracks.provider_metadata)}"
-        )
+    library = bootstrapper.core.library
+
+    # fetch lyrics in the background while the songs download
+    with bootstrapper.core.lyrics.prefetch(
+        saved_tracks.provider_metadata,
+        skip=lambda metadata: library.contains(
+            provider_id=metadata.link, artist=metadata.artist, title=metadata.title
+        ),
+    ) as lyrics_prefetch:
+        for index, track in enumerate(
+            zip(saved_tracks.provider_metadata, saved_tracks.youtube_metadata)
+        ):
+            logger.info(
+                f"Downloading track {index + 1}/{len(saved_tracks.provider_metadata)}"
+            )
+            lyrics_prefetch.advance(index)
 
-        video_info = track[1]
-        metadata = track[0]
+            video_info = track[1]
+            metadata = track[0]
 
-        try:
-            bootstrapper.app.downloader.download(
-                video_info=video_info, metadata=metadata
-            )
-        except SongNotFound as e:
-            exceptions.append(str(e))
+            try:
+                bootstrapper.app.downloader.download(
+                    video_info=video_info, metadata=metadata
+                )
+            except SongNotFound as e:
+                exceptions.append(str(e))
 
     bootstrapper.core.storage.save()
 
@@ -75,7 +85,6 @@ def download_song():
         "title",
         "uploader",
         "audio_ext",
-        "filesize",
     ]
 
     missing_video_fields = [field for field in video_fields if field not in json_data]
@@ -106,7 +115,9 @@ def download_song():
         title=json_data["title"],
         uploader=json_data["uploader"],
         audio_ext=json_data["audio_ext"],
-        filesize=int(json_data["filesize"]),
+        filesize=(
+            int(json_data["filesize"]) if json_data.get("filesize") else None
+        ),
     )
 
     try:
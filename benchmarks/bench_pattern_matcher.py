@@ -0,0 +1,90 @@
+"""Measures `PatternMatcher.match_tracks` throughput on synthetic pairs.
+
+Usage:
+    python benchmarks/bench_pattern_matcher.py [--pairs 100000] [--songs 2000]
+
+Titles and artists are drawn from a fixed pool of songs, so, like a real
+playlist run, the same strings are matched many times over.
+"""
+
+from argparse import ArgumentParser
+from random import Random
+from time import perf_counter
+
+from spots_cli.core import PatternMatcher, YouTubeExtractor
+from spots_cli.core.pattern_matcher import tokenize, uploader_penalty
+from spots_cli.models import Metadata, YTVideoInfo
+
+WORDS = (
+    "love night fire heart dance summer rain city dream gold light shadow "
+    "river wild blue midnight broken young forever home ocean storm sugar"
+).split()
+
+SUFFIXES = ["", " (Official Video)", " [Official Audio]", " (Lyrics)", " ft. Guest"]
+UPLOADERS = ["{artist}", "{artist} - Topic", "{artist}VEVO", "Lyrics Hub", "8D Tunes"]
+
+
+def build_songs(rng: Random, count: int) -> list[tuple[str, str]]:
+    return [
+        (
+            " ".join(rng.sample(WORDS, rng.randint(1, 2))).title(),
+            " ".join(rng.sample(WORDS, rng.randint(1, 4))).title(),
+        )
+        for _ in range(count)
+    ]
+
+
+def build_pairs(
+    rng: Random, songs: list[tuple[str, str]], count: int
+) -> list[tuple[YTVideoInfo, Metadata]]:
+    pairs = []
+    for _ in range(count):
+        artist, title = rng.choice(songs)
+        # mostly the same song, sometimes a different one
+        yt_artist, yt_title = (
+            (artist, title) if rng.random() < 0.7 else rng.choice(songs)
+        )
+
+        video = YTVideoInfo(
+            id="",
+            title=f"{yt_artist} - {yt_title}{rng.choice(SUFFIXES)}",
+            uploader=rng.choice(UPLOADERS).format(artist=yt_artist),
+            audio_ext="webm",
+            filesize=0,
+        )
+        metadata = Metadata(title=title, artist=artist, link="", artist_id="")
+        pairs.append((video, metadata))
+
+    return pairs
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pairs", type=int, default=100_000)
+    parser.add_argument("--songs", type=int, default=2_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = Random(args.seed)
+    pairs = build_pairs(rng, build_songs(rng, args.songs), args.pairs)
+    matcher = PatternMatcher(extractor=YouTubeExtractor())
+
+    tokenize.cache_clear()
+    uploader_penalty.cache_clear()
+
+    start = perf_counter()
+    matches = sum(
+        matcher.match_tracks(video_info=video, metadata=metadata)
+        for video, metadata in pairs
+    )
+    elapsed = perf_counter() - start
+
+    print(f"pairs:       {len(pairs)}")
+    print(f"matches:     {matches}")
+    print(f"elapsed:     {elapsed:.3f}s")
+    print(f"throughput:  {len(pairs) / elapsed:,.0f} pairs/s")
+    print(f"token cache: {tokenize.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Compares `PatternMatcher` scorers on speed and match accuracy.
+
+Usage:
+    python benchmarks/bench_scorers.py [--repeat 2000]
+
+Accuracy is measured on the labelled pairs in `fixtures/match_corpus.json`:
+accented names, abbreviations and typos that should match, and other songs,
+covers and karaoke uploads that should not. Speed is measured by matching
+the corpus `--repeat` times over.
+"""
+
+from argparse import ArgumentParser
+from json import load
+from pathlib import Path
+from time import perf_counter
+
+from spots_cli.core import PatternMatcher, YouTubeExtractor
+from spots_cli.core.pattern_matcher import SCORERS, make_scorer, tokenize
+from spots_cli.models import Metadata, YTVideoInfo
+
+CORPUS = Path(__file__).parent / "fixtures" / "match_corpus.json"
+
+
+def load_corpus() -> list[tuple[YTVideoInfo, Metadata, bool]]:
+    with open(CORPUS, encoding="utf-8") as file:
+        entries = load(file)
+
+    return [
+        (
+            YTVideoInfo(
+                id="",
+                title=entry["video"],
+                uploader=entry["uploader"],
+                audio_ext="webm",
+                filesize=0,
+            ),
+            Metadata(
+                title=entry["title"], artist=entry["artist"], link="", artist_id=""
+            ),
+            entry["match"],
+        )
+        for entry in entries
+    ]
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=2_000)
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    print(f"corpus: {len(corpus)} labelled pairs, repeated {args.repeat} times\n")
+    print(f"{'scorer':<14}{'accuracy':>10}{'recall':>8}{'false +':>9}{'pairs/s':>12}")
+
+    for name in SCORERS:
+        matcher = PatternMatcher(extractor=YouTubeExtractor(), scorer=make_scorer(name))
+        tokenize.cache_clear()
+
+        decisions = [
+            matcher.match_tracks(video_info=video, metadata=metadata)
+            for video, metadata, _ in corpus
+        ]
+        correct = sum(d == label for d, (_, _, label) in zip(decisions, corpus))
+        found = sum(d and label for d, (_, _, label) in zip(decisions, corpus))
+        positives = sum(label for _, _, label in corpus)
+        false_positives = sum(
+            d and not label for d, (_, _, label) in zip(decisions, corpus)
+        )
+
+        start = perf_counter()
+        for _ in range(args.repeat):
+            for video, metadata, _ in corpus:
+                matcher.match_tracks(video_info=video, metadata=metadata)
+        elapsed = perf_counter() - start
+
+        print(
+            f"{name:<14}"
+            f"{correct / len(corpus):>10.1%}"
+            f"{found / positives:>8.1%}"
+            f"{false_positives:>9}"
+            f"{len(corpus) * args.repeat / elapsed:>12,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Checks the cold import time of the CLI against a budget.
+
+Usage:
+    python benchmarks/bench_startup.py [--budget-ms 300] [--runs 5]
+
+Imports each module in a fresh interpreter with `-X importtime` and reports
+the best cumulative time of the runs, plus the slowest imports. Exits with
+status 1 when a module exceeds the budget, or when it loads one of the heavy
+dependencies that should only be imported by the component using them.
+"""
+
+from argparse import ArgumentParser
+from os import environ
+from pathlib import Path
+from subprocess import run
+from sys import executable, exit
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+MODULES = ("spots_cli.cli", "spots_cli.bootstrap.container")
+
+HEAVY_DEPENDENCIES = (
+    "moviepy",
+    "numpy",
+    "yt_dlp",
+    "googleapiclient.discovery",
+    "google_auth_oauthlib",
+    "spotipy",
+    "lyricsgenius",
+    "bs4",
+)
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Cumulative import time of every module loaded by `module`, in microseconds."""
+    env = environ | {"PYTHONPATH": str(SRC)}
+    result = run(
+        [executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+
+    return times
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=300)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args()
+
+    failed = False
+    for module in MODULES:
+        runs = [import_times(module) for _ in range(args.runs)]
+        best = min(runs, key=lambda times: times[module])
+        elapsed_ms = best[module] / 1000
+
+        heavy = [dep for dep in HEAVY_DEPENDENCIES if dep in best]
+        over_budget = elapsed_ms > args.budget_ms
+
+        status = "FAIL" if over_budget or heavy else "ok"
+        print(f"{module:<32}{elapsed_ms:>8.1f} ms  [{status}]")
+
+        slowest = sorted(
+            (item for item in best.items() if item[0] not in (module, "site")),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+        for name, cumulative in slowest[: args.top]:
+            print(f"    {name:<40}{cumulative / 1000:>8.1f} ms")
+
+        if heavy:
+            print(f"    heavy dependencies imported: {', '.join(heavy)}")
+
+        failed = failed or over_budget or bool(heavy)
+
+    exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Measures `YouTubeExtractor` throughput on synthetic search results.
+
+Usage:
+    python benchmarks/bench_youtube_extractor.py [--pairs 50000] [--keywords 500]
+
+Reports `extract_artist_and_title` over synthetic pairs, then
+`remove_odd_keywords` with the default keywords and with `--keywords`
+extra ones, where the trie stripper takes over from the regex.
+"""
+
+from argparse import ArgumentParser
+from random import Random
+from time import perf_counter
+
+from bench_pattern_matcher import build_pairs, build_songs
+
+from spots_cli.core import YouTubeExtractor
+from spots_cli.core.youtube_extractor import keyword_stripper
+
+
+def report(label: str, count: int, elapsed: float):
+    print(f"{label:<28}{count / elapsed:>12,.0f} calls/s")
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pairs", type=int, default=50_000)
+    parser.add_argument("--songs", type=int, default=2_000)
+    parser.add_argument("--keywords", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = Random(args.seed)
+    pairs = build_pairs(rng, build_songs(rng, args.songs), args.pairs)
+    extractor = YouTubeExtractor()
+
+    start = perf_counter()
+    for video, metadata in pairs:
+        extractor.extract_artist_and_title(video_info=video, metadata=metadata)
+    report("extract_artist_and_title", len(pairs), perf_counter() - start)
+
+    titles = [video.title for video, _ in pairs]
+
+    start = perf_counter()
+    for title in titles:
+        extractor.remove_odd_keywords(title)
+    report("remove_odd_keywords", len(titles), perf_counter() - start)
+
+    extra = [f" [Extra Keyword {i}]" for i in range(args.keywords)]
+    print(f"\nstripper with {args.keywords} extra keywords: ", end="")
+    print(type(keyword_stripper(tuple(extra))).__name__)
+
+    start = perf_counter()
+    for title in titles:
+        extractor.remove_odd_keywords(title, extra)
+    report("remove_odd_keywords (extra)", len(titles), perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
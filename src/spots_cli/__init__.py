@@ -1,15 +1,22 @@
+from __future__ import annotations
+
 from logging import getLogger
-from os.path import exists
+from os.path import dirname, exists
+from typing import TYPE_CHECKING
 
-from .bootstrap.container import Container
 from .models import (
+    MediaResourcePlaylist,
     MediaResourceSingle,
     SongNotFound,
     TitleExistsError,
     InvalidSearchFormat,
     InvalidURL,
+    YouTubeQuotaExceeded,
 )
 
+if TYPE_CHECKING:
+    from .bootstrap.container import Container
+
 logger = getLogger(__name__)
 
 
@@ -20,20 +27,27 @@ class Spots:
         if not exists(setup_file):
             setup()
 
-        self.container = Container()
+        # building the container loads every client, keep it out of package import
+        from .bootstrap import container
+
+        self.container: Container = container.Container()
         self.downloader = self.container.app.downloader
 
-    def download(self, query: str):
+    def download(self, query: str, *, sync: bool = False, prune: bool = False):
         """Downloads a song
 
         Args:
             query (str): The query to be downloaded. Can be either a query to be searched for, or a direct Spotify or YouTube download url.
+            sync (bool, optional): For a playlist, only download the tracks added since it was last synced. Defaults to False.
+            prune (bool, optional): When syncing, move the songs removed from the playlist to the `.spots-trash` folder next to them. Defaults to False.
         """
         # handle direct link
         if "https://" in query:
             logger.info(f"Processing url: {query}")
             try:
-                resolved_url = self.container.app.resolver.resolve(url=query)
+                resolved_url = self.container.app.resolver.resolve(
+                    url=query, sync=sync, skip_owned=True
+                )
             except InvalidURL as e:
                 logger.info(e)
                 return
@@ -56,16 +70,47 @@ class Spots:
                     playlist_info.provider_metadata, playlist_info.youtube_metadata
                 )
 
-                for index, [provider, youtube] in enumerate(playlist_songs):
-                    logger.info(
-                        f"Processing song: {index + 1}/{len(playlist_info.provider_metadata)}"
-                    )
-                    try:
-                        self.downloader.download(video_info=youtube, metadata=provider)
-                    except (SongNotFound, TitleExistsError) as e:
-                        logger.info(e)
-                        continue
+                library = self.container.core.library
+
+                # fetch lyrics in the background while the songs download
+                with self.container.core.lyrics.prefetch(
+                    playlist_info.provider_metadata,
+                    skip=lambda metadata: library.contains(
+                        provider_id=metadata.link,
+                        artist=metadata.artist,
+                        title=metadata.title,
+                    ),
+                ) as lyrics_prefetch:
+                    # ids of the songs downloaded or already owned
+                    done: set[str] = set()
+                    for index, [provider, youtube] in enumerate(playlist_songs):
+                        logger.info(
+                            f"Processing song: {index + 1}/{len(playlist_info.provider_metadata)}"
+                        )
+                        lyrics_prefetch.advance(index)
+                        try:
+                            downloaded = self.downloader.download(
+                                video_info=youtube, metadata=provider
+                            )
+                        except TitleExistsError as e:
+                            logger.info(e)
+                            downloaded = True
+                        except SongNotFound as e:
+                            logger.info(e)
+                            continue
+
+                        if downloaded:
+                            done.update((provider.link, youtube.id))
                 self.container.core.storage.save()
+
+                # recorded once downloaded, an interrupted sync is resumed by the next
+                snapshot = self.container.app.resolver.synced_snapshot(
+                    resolved_url, done=done
+                )
+                if snapshot:
+                    if prune:
+                        self.prune(resolved_url)
+                    self.container.core.library.save_playlist_snapshot(snapshot)
         # search query
         else:
             try:
@@ -82,20 +127,14 @@ class Spots:
                 logger.error(e)
                 return
 
-            search_result = self.container.domain.youtube_search.video_search(
-                query=query, is_general_search=True
-            )
-
-            if search_result.is_cached:
-                best_match = search_result.result[0]
-            else:
-                best_match = (
-                    self.container.core.matcher.find_best_match(
-                        search_results=search_result.result, metadata=provider_result
-                    )
-                    if provider_result
-                    else search_result.result[0]
+            if provider_result:
+                best_match = self.container.domain.youtube_search.match_track(
+                    provider_result
                 )
+            else:
+                best_match = self.container.domain.youtube_search.video_search(
+                    query=query, is_general_search=True
+                ).result[0]
 
             metadata = (
                 provider_result
@@ -114,12 +153,35 @@ class Spots:
             )
             self.container.core.storage.save()
 
-    def transfer_spotify_likes(self):
+    def prune(self, playlist: MediaResourcePlaylist):
+        """Moves the songs removed from a synced playlist to the trash, unless another synced playlist has them"""
+        from spots_cli.core.library_scanner import move_to_trash
+
+        if not playlist.snapshot:
+            return
+
+        library = self.container.core.library
+        paths = library.orphaned_paths(
+            playlist.removed_track_ids, playlist_url=playlist.snapshot.url
+        )
+        for path in paths:
+            # kept next to the song, it may not have been downloaded for this playlist
+            if exists(path):
+                trashed = move_to_trash(path, folder=dirname(path))
+                logger.info(f"Moved to the trash: {trashed}")
+
+        library.remove_paths(paths)
+
+    def transfer_spotify_likes(self, *, retry_failed: bool = False):
         """Transfers all spotify likes to YouTube library"""
         try:
-            self.container.app.youtube_user_playlist.transfer_spotify_likes_to_yt()
+            self.container.app.youtube_user_playlist.transfer_spotify_likes_to_yt(
+                retry_failed=retry_failed
+            )
         except SongNotFound:
             logger.info("No liked songs found.")
+        except YouTubeQuotaExceeded:
+            logger.info("Today's YouTube quota is used up, run again to continue.")
 
 
 __all__ = ["Spots"]
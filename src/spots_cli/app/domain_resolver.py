@@ -113,45 +113,14 @@ class DomainResolver:
                 provider_title = track.full_title
 
                 try:
-                    youtube_search_results = self.youtube_search.video_search(
-                        query=provider_title, is_general_search=True
-                    )
+                    best_match = self.youtube_search.match_track(track)
                 except SongNotFound:
                     self.core.storage.new(
                         query=provider_title, result=Sentinel(), query_type="metadata"
                     )
-                    self.core.storage.new(
-                        query=provider_title, result=Sentinel(), query_type="youtube"
-                    )
                     continue
 
-                if youtube_search_results.is_cached:
-                    cache = youtube_search_results.result[0]
-                    if isinstance(cache, Sentinel):
-                        continue
-                    else:
-                        provider_playlist.append(track)
-                        youtube_videos.append(cache)
-
-                else:
-                    try:
-                        best_match = self.core.matcher.find_best_match(
-                            search_results=youtube_search_results.result, metadata=track
-                        )
-                    except SongNotFound:
-                        self.core.storage.new(
-                            query=provider_title,
-                            result=Sentinel(),
-                            query_type="metadata",
-                        )
-                        self.core.storage.new(
-                            query=provider_title,
-                            result=Sentinel(),
-                            query_type="youtube",
-                        )
-                        continue
-
-                    provider_playlist.append(track)
-                    youtube_videos.append(best_match)
+                provider_playlist.append(track)
+                youtube_videos.append(best_match)
 
         return MatchingDomainResults(provider=provider_playlist, youtube=youtube_videos)
@@ -3,8 +3,9 @@ from __future__ import annotations
 from hashlib import md5
 from os.path import join, exists
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, cast
 
+from spots_cli.engine import LibraryEntry
 from spots_cli.models import TitleExistsError, Metadata, YTVideoInfo
 
 if TYPE_CHECKING:
@@ -42,37 +43,67 @@ class Downloader:
             file_hash = md5(filename.encode()).hexdigest()
             filename = file_hash[:25]
 
-        # check if downloaded already
-        if self.core.history.read(filename):
+        # check if downloaded already, by any of the keys the song is known by
+        if self.core.library.contains(
+            provider_id=metadata.link,
+            video_id=video_info.id,
+            artist=metadata.artist,
+            title=metadata.title,
+            filename=filename,
+        ):
             raise TitleExistsError(filename)
 
         download_folder = Path.home() / "Downloads"
         download_folder = download_folder if exists(download_folder) else Path.home()
 
-        download_path = join(
-            download_folder, directory_path, f"{filename}.{video_info.audio_ext}"
+        # the extension is only known once the format is resolved,
+        # '%' is escaped as it is special in output templates
+        download_template = join(
+            download_folder, directory_path, f"{filename.replace('%', '%%')}.%(ext)s"
         )
         converted_path = join(download_folder, directory_path, f"{filename}.mp3")
 
         # set template for download titles
-        self.clients.ytdlp.options = {"outtmpl": download_path}
+        self.clients.ytdlp.options = {"outtmpl": download_template}
 
-        # download video
-        self.clients.ytdlp.client.download([url])
-
-        self.clients.ytdlp.reset_options()
+        # resolve formats and download video
+        try:
+            info = self.clients.ytdlp.client.extract_info(url, download=True)
+            download_path = self.downloaded_file(cast(dict[str, Any], info))
+        finally:
+            self.clients.ytdlp.reset_options()
 
         # post download processing
         converted = self.core.converter.convert_to_mp3(
             old_file=download_path, new_file=converted_path
         )
-        if converted:
-            metadata_updated = self.core.converter.update_metadata(
-                audio_path=converted_path, metadata=metadata
-            )
-            if metadata_updated:
-                self.core.history.write(filename)
-        else:
+        if not converted:
+            return False
+
+        metadata_updated = self.core.converter.update_metadata(
+            audio_path=converted_path, metadata=metadata
+        )
+        # an untagged song isn't recorded, so a sync retries it
+        if not metadata_updated:
             return False
 
+        self.core.history.write(filename)
+        self.core.library.add(
+            LibraryEntry(
+                artist=metadata.artist,
+                title=metadata.title,
+                provider_id=metadata.link,
+                video_id=video_info.id,
+                filename=filename,
+                path=converted_path,
+            )
+        )
         return True
+
+    def downloaded_file(self, info: dict[str, Any]) -> str:
+        """The path yt-dlp downloaded a video to."""
+        requested = info.get("requested_downloads")
+        if requested and requested[0].get("filepath"):
+            return requested[0]["filepath"]
+
+        return self.clients.ytdlp.client.prepare_filename(info)
@@ -1,17 +1,20 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from logging import getLogger
 from os.path import join
 from tenacity import stop_after_delay
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Callable, Sequence, TypeVar, cast
 
 from spots_cli.engine import retry
 from spots_cli.models import (
     InvalidURL,
+    Metadata,
     SongNotFound,
     MediaResourceSingle,
     MediaResourcePlaylist,
     PlaylistInfo,
+    PlaylistSnapshot,
     Sentinel,
     YTVideoInfo,
 )
@@ -23,6 +26,8 @@ if TYPE_CHECKING:
 
 logger = getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class MediaResolver:
     def __init__(
@@ -37,13 +42,113 @@ class MediaResolver:
         self.domain = domain
         self.clients = clients
 
+    def tracks_not_owned(self, tracks: Sequence[Metadata | Sentinel]) -> list[Metadata]:
+        """
+        Drops the tracks already in the library, by provider link or artist and
+        title, so only new tracks of a playlist are searched on YouTube.
+        """
+        new_tracks = [
+            track
+            for track in tracks
+            if not isinstance(track, Sentinel)
+            and not self.core.library.contains(
+                provider_id=track.link, artist=track.artist, title=track.title
+            )
+        ]
+
+        owned = len(tracks) - len(new_tracks)
+        if owned:
+            logger.info(f"Skipping {owned} songs already in the library")
+
+        return new_tracks
+
+    def videos_not_owned(self, videos: Sequence[YTVideoInfo]) -> list[YTVideoInfo]:
+        """
+        Drops the videos already in the library, by video id or download
+        filename, so only new videos of a playlist are matched with the provider.
+        """
+        new_videos = [
+            video
+            for video in videos
+            if not self.core.library.contains(
+                video_id=video.id, filename=video.full_title.replace("/", "|")
+            )
+        ]
+
+        owned = len(videos) - len(new_videos)
+        if owned:
+            logger.info(f"Skipping {owned} songs already in the library")
+
+        return new_videos
+
+    @staticmethod
+    def diff_snapshot(
+        tracks: Sequence[T],
+        *,
+        key: Callable[[T], str],
+        previous: PlaylistSnapshot | None,
+    ) -> tuple[list[T], list[str]]:
+        """
+        The tracks added to a playlist since its `previous` snapshot, and the ids
+        of the tracks removed from it. Without a snapshot, every track is added.
+        """
+        if previous is None:
+            return list(tracks), []
+
+        known = set(previous.track_ids)
+        current = {key(track) for track in tracks}
+
+        added = [track for track in tracks if key(track) not in known]
+        removed = [
+            track_id for track_id in previous.track_ids if track_id not in current
+        ]
+
+        logger.info(
+            f"{len(added)} tracks added, {len(removed)} removed since the last sync"
+        )
+        return added, removed
+
+    @staticmethod
+    def synced_snapshot(
+        playlist: MediaResourcePlaylist, *, done: set[str]
+    ) -> PlaylistSnapshot | None:
+        """
+        The snapshot to save once a playlist is downloaded, given the ids of the
+        tracks `done`. Pending tracks that weren't are left out, so the next sync
+        retries them, and the provider version is only kept once none are left.
+        """
+        if playlist.snapshot is None:
+            return None
+
+        failed = {
+            track_id
+            for track_id in playlist.pending_track_ids
+            if track_id not in done
+        }
+        if not failed:
+            return playlist.snapshot
+
+        logger.info(f"{len(failed)} tracks not downloaded, retried on the next sync")
+        return replace(
+            playlist.snapshot,
+            snapshot_id=None,
+            track_ids=[
+                track_id
+                for track_id in playlist.snapshot.track_ids
+                if track_id not in failed
+            ],
+        )
+
     @retry(stop=stop_after_delay(60))
-    def resolve(self, *, url: str) -> MediaResourceSingle | MediaResourcePlaylist:
+    def resolve(
+        self, *, url: str, sync: bool = False, skip_owned: bool = False
+    ) -> MediaResourceSingle | MediaResourcePlaylist:
         """Converts a youtube or spotify url to mp3, or a youtube video to mp3
 
         Args:
             url (str): url to be converted
-            single: (bool, optional): don't search for recommended tracks if false. Defaults to False
+            sync (bool, optional): only resolve the tracks added to a playlist since it was last synced. Defaults to False
+            skip_owned (bool, optional): leave out the playlist songs already in the library. Defaults to False
 
         Raises:
             InvalidURL: if provided url not available
@@ -59,12 +164,7 @@ class MediaResolver:
                 metadata = self.domain.provider_metadata.get(track_id=track_id)
 
                 # search on YouTube
-                youtube_results = self.domain.youtube_search.video_search(
-                    query=metadata.full_title, is_general_search=True
-                )
-                best_match = self.core.matcher.find_best_match(
-                    search_results=youtube_results.result, metadata=metadata
-                )
+                best_match = self.domain.youtube_search.match_track(metadata)
 
                 return MediaResourceSingle(
                     resource_type="single",
@@ -74,10 +174,59 @@ class MediaResolver:
             # playlist
             else:
                 logger.debug("Resource type: playlist")
+                previous = self.core.library.playlist_snapshot(url) if sync else None
+
+                # an unchanged version skips listing the tracks
+                if previous and previous.snapshot_id:
+                    snapshot_id = self.domain.provider_search.playlist_snapshot(url)
+                    if snapshot_id == previous.snapshot_id:
+                        logger.info(f"{previous.name} is unchanged since the last sync")
+                        return MediaResourcePlaylist(
+                            resource_type="playlist",
+                            playlist_info=PlaylistInfo(
+                                name=previous.name,
+                                cover="",
+                                provider_metadata=[],
+                                youtube_metadata=[],
+                                snapshot_id=snapshot_id,
+                            ),
+                            snapshot=previous,
+                        )
+
                 playlist_info = self.domain.provider_search.search_playlist(url)
+                tracks = [
+                    track
+                    for track in playlist_info.provider_metadata
+                    if not isinstance(track, Sentinel)
+                ]
+                snapshot = PlaylistSnapshot(
+                    url=url,
+                    name=playlist_info.name,
+                    snapshot_id=playlist_info.snapshot_id,
+                    track_ids=[track.link for track in tracks],
+                )
+                added, removed = self.diff_snapshot(
+                    tracks, key=lambda track: track.link, previous=previous
+                )
+
+                # owned songs are dropped before their YouTube search
+                if skip_owned:
+                    added = self.tracks_not_owned(added)
+
+                domain_matches = self.domain_resolver.filter_matching_domain_results(
+                    provider_results=added
+                )
 
                 return MediaResourcePlaylist(
-                    resource_type="playlist", playlist_info=playlist_info
+                    resource_type="playlist",
+                    playlist_info=replace(
+                        playlist_info,
+                        provider_metadata=domain_matches.provider,
+                        youtube_metadata=domain_matches.youtube,
+                    ),
+                    snapshot=snapshot if sync else None,
+                    removed_track_ids=removed,
+                    pending_track_ids=[track.link for track in added],
                 )
 
         # process youtube link
@@ -86,7 +235,7 @@ class MediaResolver:
             # playlist
             if "playlist" in url:
                 logger.debug("Resource type: playlist")
-                playlist_search = self.clients.ytdlp.client.extract_info(
+                playlist_search = self.clients.ytdlp.flat_client.extract_info(
                     url, download=False
                 )
 
@@ -95,19 +244,25 @@ class MediaResolver:
 
                 playlist_search = cast(dict[str, Any], playlist_search)
 
-                videos_list = [
-                    YTVideoInfo(
-                        id=result["id"],
-                        filesize=self.domain.youtube_search.get_video_size(result),
-                        title=result["title"],
-                        uploader=result["uploader"],
-                        audio_ext=result["audio_ext"],
-                    )
+                videos = [
+                    self.domain.youtube_search.to_video_info(result)
                     for result in playlist_search["entries"]
                 ]
+                previous = self.core.library.playlist_snapshot(url) if sync else None
+                snapshot = PlaylistSnapshot(
+                    url=url,
+                    name=playlist_search["title"],
+                    track_ids=[video.id for video in videos],
+                )
+                added, removed = self.diff_snapshot(
+                    videos, key=lambda video: video.id, previous=previous
+                )
+
+                if skip_owned:
+                    added = self.videos_not_owned(added)
 
                 domain_matches = self.domain_resolver.filter_matching_domain_results(
-                    youtube_results=videos_list
+                    youtube_results=added
                 )
 
                 cover = self.clients.secrets.read(
@@ -123,7 +278,11 @@ class MediaResolver:
                 )
 
                 return MediaResourcePlaylist(
-                    resource_type="playlist", playlist_info=playlist_info
+                    resource_type="playlist",
+                    playlist_info=playlist_info,
+                    snapshot=snapshot if sync else None,
+                    removed_track_ids=removed,
+                    pending_track_ids=[video.id for video in added],
                 )
             else:
                 logger.debug("Resource type: single")
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from logging import getLogger
 from spots_cli.models.errors import EmptySpotifyLikes, SongNotFound
-from spotipy.exceptions import SpotifyException
 from tenacity import stop_after_delay
 from spots_cli.engine import retry
 from typing import TYPE_CHECKING
@@ -30,6 +30,10 @@ class ArtistResult:
 class SpotifyPlaylistCompilation:
     """A service for retrieving a collection of playlists from Spotify"""
 
+    ALBUM_URL = "https://open.spotify.com/album/"
+    ALBUMS_PAGE_SIZE = 50
+    ALBUM_WORKERS = 8
+
     def __init__(
         self,
         *,
@@ -72,11 +76,7 @@ class SpotifyPlaylistCompilation:
                 essentials_playlist
             )
 
-            scraped_playlist = [
-                track
-                for track_id in essentials_playlist_data.ids
-                if (track := self.metadata.get(track_id=track_id))
-            ]
+            scraped_playlist = self.metadata.get_many(essentials_playlist_data.ids)
             domain_matches = self.domain_resolver.filter_matching_domain_results(
                 provider_results=scraped_playlist
             )
@@ -124,35 +124,41 @@ class SpotifyPlaylistCompilation:
                 "Spotify client is not configured. Enable Spotify features in your environment."
             )
 
-        result = self.clients.spotify.client.artist_albums(artist_id)
+        spotify = self.clients.spotify.client
+        result = spotify.artist_albums(artist_id, limit=self.ALBUMS_PAGE_SIZE)
         if not result:
             return ArtistResult(
                 playlist=all_artist_albums, name=artist_name, cover=artist_cover
             )
 
-        # filter albums for the specified artist
-        artist_albums = list(
-            filter(
-                lambda item: any(
-                    artist_obj["name"].lower() == artist.lower()
-                    for artist_obj in item["artists"]
-                ),
-                result["items"],
-            )
-        )
+        # collect every page of the discography, deduplicated by album id
+        album_ids: dict[str, None] = {}
+        while result:
+            for item in result["items"]:
+                album_ids[item["id"]] = None
 
-        artist_albums = result["items"]
+            result = spotify.next(result) if result.get("next") else None
 
-        for item in artist_albums:
-            # get all tracks of album
-            album_url = "https://open.spotify.com/album/" + item["id"]
+        album_urls = [self.ALBUM_URL + album_id for album_id in album_ids]
+        logger.debug(f"Retrieving {len(album_urls)} albums for {artist_name}...")
 
-            all_artist_albums.append(self.spotify_search.search_album(album_url))
+        # get all tracks of each album
+        with ThreadPoolExecutor(max_workers=self.ALBUM_WORKERS) as executor:
+            for album in executor.map(self._search_album, album_urls):
+                if album:
+                    all_artist_albums.append(album)
 
         return ArtistResult(
             playlist=all_artist_albums, name=artist_name, cover=artist_cover
         )
 
+    def _search_album(self, album_url: str) -> PlaylistInfo | None:
+        try:
+            return self.spotify_search.search_album(album_url)
+        except SongNotFound:
+            logger.debug(f"Album not found: {album_url}")
+            return None
+
     def user_saved_tracks(self) -> PlaylistInfo:
         """retrieves a user's saved tracks
 
@@ -181,6 +187,8 @@ class SpotifyPlaylistCompilation:
 
         # NOTE: Spotify now requires a paid subscription to use the API
         logger.info("Searching for user saved tracks...")
+        from spotipy.exceptions import SpotifyException
+
         limit = 50
         user_tracks = None
 
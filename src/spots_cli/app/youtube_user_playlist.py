@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from googleapiclient.errors import HttpError
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property
 from logging import getLogger
-from socket import timeout as SocketTimeout
 from tenacity import stop_after_attempt, wait_exponential
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator, Optional
 
-from spots_cli.engine import retry
+from spots_cli.engine import MigrationItem, MigrationQueue, retry
 from spots_cli.models import (
     SongNotFound,
     YouTubeQuotaExceeded,
@@ -21,12 +22,19 @@ if TYPE_CHECKING:
     from spots_cli.app.spotify_playlist_compilation import SpotifyPlaylistCompilation
     from spots_cli.services.youtube_search_service import YoutubeSearchService
     from spots_cli.clients import YouTubeApiClient
+    from googleapiclient.errors import HttpError
 
 
 logger = getLogger(__name__)
 
 
 class YouTubeUserPlaylist:
+    # video ratings sent per batch HTTP request
+    RATE_BATCH_SIZE = 50
+
+    # tracks searched ahead of the rate calls
+    SEARCH_AHEAD = 10
+
     def __init__(
         self,
         *,
@@ -69,6 +77,7 @@ class YouTubeUserPlaylist:
                 )
             )
 
+            self.core.quota.spend("list")
             response = request.execute()
 
             for item in response.get("items", []):
@@ -82,69 +91,178 @@ class YouTubeUserPlaylist:
 
         return liked_videos
 
-    @retry(stop=stop_after_attempt(5), wait=wait_exponential(min=1, max=10))
-    def _like_video(self, video_id: str):
+    @staticmethod
+    def rating_error_reason(error: HttpError) -> Optional[str]:
+        """The reason of a 403 error returned by a rate call, if any."""
+        status = getattr(error.resp, "status", None)
+        details = getattr(error, "error_details", None)
+        if status == 403 and isinstance(details, list) and details:
+            return details[0].get("reason")
+        return None
+
+    @cached_property
+    def queue(self) -> MigrationQueue:
+        """The persisted likes migration, oldest liked track first."""
+        return MigrationQueue(name="likes")
+
+    def _queue_likes(self, tracks: list[Metadata]) -> int:
         """
-        Like a video with retry on transient failures.
+        Appends the liked tracks not queued yet, keeping the outcome of likes
+        migrated before the queue existed.
 
-        Args:
-            video_id (str): the id of the video to be added.
+        Returns:
+            int: The number of tracks queued.
         """
-        try:
-            self._youtube().service.videos().rate(id=video_id, rating="like").execute()
-        except (SocketTimeout, TimeoutError) as e:
-            # Retryable network error
-            logger.info(f"[Network Timeout] Retrying like for {video_id}: {e}")
-            raise  # Tenacity will retry
-        except HttpError as e:
-            # API-level error (bad ID, auth, quota, etc.)
-            raise
-
-    def like_video(self, *, video: YTVideoInfo, metadata: Metadata) -> bool:
+        items: list[MigrationItem] = []
+        for track in tracks:
+            spotify_title = f"{track.artist} - {track.title}"
+            if spotify_title in self.queue:
+                continue
+
+            try:
+                liked = self.core.storage.get(
+                    query=spotify_title, query_type="yt_likes"
+                )
+            except SongNotFound:
+                items.append(MigrationItem(key=spotify_title, state="searched"))
+                continue
+
+            items.append(
+                MigrationItem(key=spotify_title, state="liked", video=liked)
+                if liked
+                else MigrationItem(key=spotify_title)
+            )
+
+        return self.queue.extend(items)
+
+    def _search_ahead(
+        self, executor: ThreadPoolExecutor, tracks: dict[str, Metadata]
+    ) -> Iterator[tuple[MigrationItem, Metadata, Future[YTVideoInfo]]]:
         """
-        Adds a video to YouTube likes.
+        Yields the incomplete items of the queue with the search of their video,
+        keeping `SEARCH_AHEAD` searches running ahead of the consumer.
 
-        Args:
-            video (YTVideoInfo): the video to be added.
-            metadata (Metadata): the metadata for the video.
+        Matched items reuse their video, items no longer liked are dropped.
+        """
+        window: deque[tuple[MigrationItem, Metadata, Future[YTVideoInfo]]] = deque()
+
+        for item in self.queue.incomplete():
+            track = tracks.get(item.key)
+            if track is None:
+                self.queue.mark(item.key, "searched", error="no longer liked")
+                continue
+
+            if item.state == "matched" and item.video:
+                search: Future[YTVideoInfo] = Future()
+                search.set_result(item.video)
+            else:
+                search = executor.submit(self.search.match_track, track)
+
+            window.append((item, track, search))
+            if len(window) > self.SEARCH_AHEAD:
+                yield window.popleft()
+
+        yield from window
+
+    def _rate_batch(self, video_ids: list[str]) -> list[Optional[Exception]]:
+        """
+        Likes the videos in one batch HTTP request.
 
         Returns:
-            bool: True if added to likes
+            list[Optional[Exception]]: The error of each rate call, None if it succeeded.
         """
-        video_id = video.id
-        title = f"{video.uploader} - {video.title}"
-        titles_match = self.core.matcher.match_tracks(
-            video_info=video, metadata=metadata
-        )
-        if titles_match:
-            try:
-                logger.info(f"Trying to add {title} to likes")
-                self._like_video(video_id)
-                return True
-            except HttpError as e:
-                status = getattr(e.resp, "status", None)
-                details = getattr(e, "error_details", None)
-                if status == 403 and isinstance(details, list) and details:
-                    reason = details[0].get("reason")
-
-                    if reason == "videoRatingDisabled":
-                        return False
-                    elif reason == "quotaExceeded":
-                        raise YouTubeQuotaExceeded()
-                    else:
-                        logger.error("Unexpected reason:")
-                        logger.error(reason)
-                        raise
-                raise
-            except Exception as e:
-                raise
-
-        logger.debug(f"No match found for {title}")
-        return False
-
-    def transfer_spotify_likes_to_yt(self):
+        # each rate in the batch is charged as a separate call, once however
+        # many attempts the batch takes
+        self.core.quota.spend("rate", len(video_ids))
+        return self._send_rate_batch(video_ids)
+
+    @retry(stop=stop_after_attempt(5), wait=wait_exponential(min=1, max=10))
+    def _send_rate_batch(self, video_ids: list[str]) -> list[Optional[Exception]]:
+        service = self._youtube().service
+        errors: list[Optional[Exception]] = [None] * len(video_ids)
+
+        def collect(request_id: str, response, exception: Optional[Exception]):
+            errors[int(request_id)] = exception
+
+        batch = service.new_batch_http_request(callback=collect)
+        for position, video_id in enumerate(video_ids):
+            batch.add(
+                service.videos().rate(id=video_id, rating="like"),
+                request_id=str(position),
+            )
+
+        batch.execute()
+
+        return errors
+
+    def _like_batch(self, batch: list[tuple[MigrationItem, YTVideoInfo]]) -> bool:
+        """
+        Likes the matched videos of a batch of items and records the results.
+
+        Returns:
+            bool: True if a rate call was refused for quota.
+        """
+        from googleapiclient.errors import HttpError
+
+        try:
+            errors = self._rate_batch([video.id for _, video in batch])
+        except Exception as e:
+            for item, _ in batch:
+                self.queue.mark(item.key, "failed", error=str(e))
+            return False
+
+        quota_hit = False
+        for (item, video), error in zip(batch, errors):
+            if error is None:
+                self.queue.mark(item.key, "liked")
+                self.core.storage.new(
+                    query=item.key, result=video, query_type="yt_likes"
+                )
+                logger.info(f"✅ Liked: {item.key}")
+                continue
+
+            reason = (
+                self.rating_error_reason(error)
+                if isinstance(error, HttpError)
+                else None
+            )
+            if reason == "quotaExceeded":
+                # stays matched, liked on the next run
+                quota_hit = True
+            elif reason == "videoRatingDisabled":
+                logger.info(f"Failed to add {item.key} to likes")
+                self.queue.mark(item.key, "searched", error=reason)
+                self.core.storage.new(
+                    query=item.key, result=Sentinel(), query_type="yt_likes"
+                )
+            else:
+                self.queue.mark(item.key, "failed", error=str(error))
+
+        if quota_hit:
+            self.core.quota.exhaust()
+
+        return quota_hit
+
+    def _checkpoint(self) -> None:
+        self.queue.save()
+        self.core.storage.save()
+        self.core.quota.save()
+
+    def transfer_spotify_likes_to_yt(self, *, retry_failed: bool = False):
         """
         Adds each track in a users Spotify liked library, to the users YouTube likes
+
+        The tracks go through a persisted work queue, oldest first, so a
+        migration stopped by the daily quota or killed resumes from its first
+        incomplete track. Searches run ahead of the rate calls, which are sent
+        in batches sized to what is left of the day's quota.
+
+        Args:
+            retry_failed (bool, optional): Retry the tracks that failed with an
+                unexpected error in an earlier run. Defaults to False.
+
+        Raises:
+            YouTubeQuotaExceeded: if the day's quota ran out before the last track.
         """
         # get user liked tracks from spotify
         tracks = self.spotify_playlist_compiler.user_saved_tracks()
@@ -152,64 +270,68 @@ class YouTubeUserPlaylist:
         # save newly added liked tracks
         self.core.storage.save()
 
-        unexpected_errors = []
-        playlist_len = len(tracks.provider_metadata)
-
-        # try to find the youtube video for each track
-        for index, track in enumerate(tracks.provider_metadata):
-            spotify_title = f"{track.artist} - {track.title}"
+        # oldest first, tracks liked since the last run are appended to the queue
+        liked_tracks = list(reversed(tracks.provider_metadata))
+        queued = self._queue_likes(liked_tracks)
+        retried = self.queue.retry_failed() if retry_failed else 0
+        self.queue.save()
+
+        quota = self.core.quota
+        remaining = len(self.queue) - self.queue.head
+        logger.info(
+            f"Migrating likes: {queued} newly queued, {retried} retried, "
+            f"resuming at track {self.queue.head + 1} of {len(self.queue)}, "
+            f"{quota.affordable('rate')} likes left in today's quota"
+        )
 
-            if self.core.storage.get(query=spotify_title, query_type="yt_likes"):
-                logger.info(f"🗄 Already Liked: {spotify_title}")
-                continue
+        if remaining and not quota.affordable("rate"):
+            logger.error("Quota exceeded")
+            raise YouTubeQuotaExceeded()
 
-            video_added_to_likes = False
+        by_key = {f"{track.artist} - {track.title}": track for track in liked_tracks}
+        batch: list[tuple[MigrationItem, YTVideoInfo]] = []
+        quota_hit = False
 
-            try:
-                search_results = self.search.video_search(
-                    query=spotify_title, is_general_search=True
-                )
-            except SongNotFound:
-                continue
-            except Exception as e:
-                unexpected_errors.append(str(e))
-                continue
-
-            try:
-                best_match = self.core.matcher.find_best_match(
-                    search_results=search_results.result, metadata=track
-                )
-                video_added_to_likes = self.like_video(video=best_match, metadata=track)
-                if video_added_to_likes:
-                    self.core.storage.new(
-                        query=spotify_title,
-                        result=best_match,
-                        query_type="yt_likes",
-                    )
-                else:
-                    logger.info(f"Failed to add {spotify_title} to likes")
-                    self.core.storage.new(
-                        query=spotify_title, result=Sentinel(), query_type="yt_likes"
-                    )
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            for item, track, search in self._search_ahead(executor, by_key):
+                try:
+                    video = search.result()
+                except SongNotFound:
+                    self.queue.mark(item.key, "searched")
+                    continue
+                except Exception as e:
+                    self.queue.mark(item.key, "failed", error=str(e))
                     continue
-            except SongNotFound:
-                continue
-            except YouTubeQuotaExceeded:
-                self.core.storage.save()
-                logger.error("Quota exceeded")
-                raise
-            except Exception as e:
-                unexpected_errors.append(str(e))
-                continue
 
-            if (index % 10 == 0) or (index == (playlist_len - 1)):
-                self.core.storage.save()
+                self.queue.mark(item.key, "matched", video=video)
+                batch.append((item, video))
 
-            logger.info(f"✅ Liked: {spotify_title}")
+                if len(batch) < min(self.RATE_BATCH_SIZE, quota.affordable("rate")):
+                    continue
 
-        self.core.storage.save()
+                quota_hit = self._like_batch(batch)
+                batch = []
+                self._checkpoint()
+
+                if quota_hit or not quota.affordable("rate"):
+                    break
+            else:
+                if batch:
+                    quota_hit = self._like_batch(batch)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            self._checkpoint()
+
+        failed = self.queue.failed()
+        if failed:
+            logger.error(
+                f"{len(failed)} tracks failed, run again with --retry-failed to retry them"
+            )
+            for item in failed:
+                logger.error(f"{item.key}: {item.error}")
 
-        if len(unexpected_errors):
-            logger.error("Unexpected errors occurred")
-            for unexpected in unexpected_errors:
-                logger.error(unexpected)
+        left = len(list(self.queue.incomplete()))
+        if left:
+            logger.error(f"Quota exceeded, {left} tracks left for the next run")
+            raise YouTubeQuotaExceeded()
@@ -1,5 +1,7 @@
-from dataclasses import dataclass
-from logging import DEBUG, ERROR, basicConfig, INFO, getLogger
+from __future__ import annotations
+
+from functools import cached_property
+from logging import DEBUG, basicConfig, INFO, getLogger
 from os.path import exists
 
 from spots_cli.app import (
@@ -24,7 +26,13 @@ from spots_cli.core import (
     VideoConverter,
     YouTubeExtractor,
 )
-from spots_cli.engine import FileStorage
+from spots_cli.core.pattern_matcher import make_scorer
+from spots_cli.engine import (
+    FileStorage,
+    LibraryIndex,
+    QuotaBudget,
+    storage,
+)
 from spots_cli.models import MetadataProvider, SearchProvider
 from spots_cli.services import (
     YoutubeSearchService,
@@ -40,191 +48,236 @@ from spots_cli.utils import get_config_path
 logger = getLogger(__name__)
 
 
-@dataclass
 class Core:
-    history: HistoryManager
-    lyrics: LyricsFinder
-    matcher: PatternMatcher
-    converter: VideoConverter
-    scraper: WebScraper
-    extractor: YouTubeExtractor
-    storage: FileStorage
-
-
-@dataclass
-class Clients:
-    spotify: SpotifyClient | None
-    youtube: YouTubeApiClient | None
-    ytdlp: YtDlpClient
-    secrets: SecretsManager
-    deezer: DeezerClient
-
-
-@dataclass
-class Domain:
-    provider_search: SearchProvider
-    provider_metadata: MetadataProvider
-    youtube_search: YoutubeSearchService
-    youtube_metadata: YouTubeMetadataService
-
-
-@dataclass
-class App:
-    downloader: Downloader
-    resolver: MediaResolver
-    spotify_playlist_compiler: SpotifyPlaylistCompilation
-    youtube_user_playlist: YouTubeUserPlaylist
-    spotify_playlist_modify: SpotifyUserPlaylistModify
-    domain_resolver: DomainResolver
-
-
-class Container:
-    def __init__(self):
-        self.__path = get_config_path() / ".bootstrapped"
-
-        secrets = SecretsManager()
-        environment_mode = secrets.read(key="environment_mode", alt="PRODUCTION")
-        basicConfig(level=INFO if environment_mode.lower() == "production" else DEBUG)
-        getLogger("googleapiclient.discovery_cache").setLevel(ERROR)
-
-        logger.debug("Bootstrapping app...")
-
-        self.initial_setup()
+    """Core components, each built on first access and shared afterwards."""
 
-        logger.debug("Setting up core components...")
-        self.core = self._build_core()
-        self.clients = self._build_clients()
-        self.domain = self._build_domain()
-        self.app = self._build_application()
-        logger.debug("Components setup complete.")
+    def __init__(self, *, secrets: SecretsManager):
+        self.secrets = secrets
 
-        # cache
+    @cached_property
+    def storage(self) -> FileStorage:
+        # the module-level cache, also used by the pattern matcher
         logger.debug("Loading cache into memory...")
-        self.core.storage.cache_file_exists()
-        self.core.storage.reload()
+        storage.load()
         logger.debug("Cache loaded.")
+        return storage
+
+    @cached_property
+    def history(self) -> HistoryManager:
+        return HistoryManager()
+
+    @cached_property
+    def library(self) -> LibraryIndex:
+        library = LibraryIndex()
+        library.import_history(self.history.titles)
+        return library
+
+    @cached_property
+    def scraper(self) -> WebScraper:
+        return WebScraper()
+
+    @cached_property
+    def extractor(self) -> YouTubeExtractor:
+        return YouTubeExtractor()
+
+    @cached_property
+    def lyrics(self) -> LyricsFinder:
+        return LyricsFinder(
+            scraper=self.scraper, secrets_manager=self.secrets, storage=self.storage
+        )
 
-        logger.debug("Bootstrap complete. App ready for use.")
-
-    def initial_setup(self) -> None:
-        if not exists(self.__path):
-            logger.debug("Running initial setup...")
-            logger.debug("Creating internal files used for tracking downloads...")
-
-            # downloads history
-            logger.debug("Creating downloads history file...")
-            history = HistoryManager()
-            history.history_file_exists()
-            logger.debug("History file created.")
+    @cached_property
+    def matcher(self) -> PatternMatcher:
+        return PatternMatcher(
+            extractor=self.extractor,
+            scorer=make_scorer(self.secrets.read(key="match_scorer", alt="token")),
+            # comma separated channel ids
+            blocked_channels=[
+                channel_id.strip()
+                for channel_id in self.secrets.read(
+                    key="blocked_channels", alt=""
+                ).split(",")
+                if channel_id.strip()
+            ],
+        )
 
-            with open(self.__path, "w"):
-                pass
+    @cached_property
+    def converter(self) -> VideoConverter:
+        return VideoConverter(lyrics=self.lyrics)
+
+    @cached_property
+    def quota(self) -> QuotaBudget:
+        return QuotaBudget(
+            daily_limit=int(
+                self.secrets.read(
+                    key="youtube_daily_quota", alt=str(QuotaBudget.DEFAULT_DAILY_LIMIT)
+                )
+            )
+        )
 
-            logger.debug("Download manager files setup complete.")
 
-    def _build_clients(self) -> Clients:
-        secrets = SecretsManager()
+class Clients:
+    """API clients, each built on first access and shared afterwards."""
 
-        youtube = None
-        if secrets.read(key="youtube_account_access", alt="false").lower() == "true":
-            youtube = YouTubeApiClient()
+    def __init__(self, *, secrets: SecretsManager):
+        self.secrets = secrets
 
-        spotify = None
-        if (
-            secrets.read(key="spotify_features_available", alt="false").lower()
+    @property
+    def youtube_available(self) -> bool:
+        return (
+            self.secrets.read(key="youtube_account_access", alt="false").lower()
             == "true"
-        ):
-            spotify = SpotifyClient()
-
-        return Clients(
-            spotify=spotify,
-            youtube=youtube,
-            ytdlp=YtDlpClient(secrets=secrets),
-            secrets=secrets,
-            deezer=DeezerClient(),
         )
 
-    def _build_core(self) -> Core:
-        scraper = WebScraper()
-        secrets_manager = SecretsManager()
-        extractor = YouTubeExtractor()
-
-        return Core(
-            storage=FileStorage(),
-            history=HistoryManager(),
-            lyrics=LyricsFinder(scraper=scraper, secrets_manager=secrets_manager),
-            matcher=PatternMatcher(extractor=extractor),
-            converter=VideoConverter(),
-            scraper=WebScraper(),
-            extractor=YouTubeExtractor(),
+    @property
+    def spotify_available(self) -> bool:
+        return (
+            self.secrets.read(key="spotify_features_available", alt="false").lower()
+            == "true"
         )
 
-    def _build_domain(self) -> Domain:
-        youtube_search = YoutubeSearchService(clients=self.clients, core=self.core)
+    @cached_property
+    def youtube(self) -> YouTubeApiClient | None:
+        return YouTubeApiClient() if self.youtube_available else None
 
-        provider_metadata = ProvidersMetadata(
-            clients=self.clients,
-            core=self.core,
-        )
+    @cached_property
+    def spotify(self) -> SpotifyClient | None:
+        return SpotifyClient() if self.spotify_available else None
 
-        provider_search = ProviderSearchContainer(
-            clients=self.clients, metadata=provider_metadata.metadata, core=self.core
-        )
+    @cached_property
+    def ytdlp(self) -> YtDlpClient:
+        return YtDlpClient(secrets=self.secrets)
+
+    @cached_property
+    def deezer(self) -> DeezerClient:
+        return DeezerClient()
 
-        youtube_metadata = YouTubeMetadataService(
-            search=provider_search.main, clients=self.clients, core=self.core
-        )
 
-        return Domain(
-            youtube_search=youtube_search,
-            provider_search=provider_search.main,
-            provider_metadata=provider_metadata.metadata,
-            youtube_metadata=youtube_metadata,
+class Domain:
+    """Search and metadata services, each built on first access and shared afterwards."""
+
+    def __init__(self, *, core: Core, clients: Clients):
+        self.core = core
+        self.clients = clients
+
+    @cached_property
+    def youtube_search(self) -> YoutubeSearchService:
+        return YoutubeSearchService(clients=self.clients, core=self.core)
+
+    @cached_property
+    def provider_metadata(self) -> MetadataProvider:
+        return ProvidersMetadata(clients=self.clients, core=self.core).metadata
+
+    @cached_property
+    def provider_search(self) -> SearchProvider:
+        return ProviderSearchContainer(
+            clients=self.clients, metadata=self.provider_metadata, core=self.core
+        ).main
+
+    @cached_property
+    def youtube_metadata(self) -> YouTubeMetadataService:
+        return YouTubeMetadataService(
+            search=self.provider_search, clients=self.clients, core=self.core
         )
 
-    def _build_application(self) -> App:
-        downloader = Downloader(core=self.core, clients=self.clients)
 
-        youtube_search = YoutubeSearchService(clients=self.clients, core=self.core)
-        domain_resolver = DomainResolver(
+class App:
+    """Application services, each built on first access and shared afterwards."""
+
+    def __init__(self, *, core: Core, clients: Clients, domain: Domain):
+        self.core = core
+        self.clients = clients
+        self.domain = domain
+
+    @cached_property
+    def downloader(self) -> Downloader:
+        return Downloader(core=self.core, clients=self.clients)
+
+    @cached_property
+    def domain_resolver(self) -> DomainResolver:
+        return DomainResolver(
             core=self.core,
-            youtube_search=youtube_search,
+            youtube_search=self.domain.youtube_search,
             provider_search=self.domain.provider_search,
         )
 
-        resolver = MediaResolver(
+    @cached_property
+    def resolver(self) -> MediaResolver:
+        return MediaResolver(
             core=self.core,
             domain=self.domain,
             clients=self.clients,
-            domain_resolver=domain_resolver,
+            domain_resolver=self.domain_resolver,
         )
-        spotify_playlist_modify = SpotifyUserPlaylistModify(clients=self.clients)
 
-        spotify_metadata = SpotifyMetadataService(clients=self.clients, core=self.core)
+    @cached_property
+    def spotify_playlist_modify(self) -> SpotifyUserPlaylistModify:
+        return SpotifyUserPlaylistModify(clients=self.clients)
+
+    @cached_property
+    def spotify_metadata(self) -> SpotifyMetadataService:
+        return SpotifyMetadataService(clients=self.clients, core=self.core)
 
-        spotify_search = SpotifySearchService(
-            metadata=spotify_metadata, clients=self.clients, core=self.core
+    @cached_property
+    def spotify_search(self) -> SpotifySearchService:
+        return SpotifySearchService(
+            metadata=self.spotify_metadata, clients=self.clients, core=self.core
         )
-        spotify_playlist_compiler = SpotifyPlaylistCompilation(
+
+    @cached_property
+    def spotify_playlist_compiler(self) -> SpotifyPlaylistCompilation:
+        return SpotifyPlaylistCompilation(
             core=self.core,
             domain=self.domain,
             clients=self.clients,
-            metadata=spotify_metadata,
-            spotify_search=spotify_search,
-            domain_resolver=domain_resolver,
+            metadata=self.spotify_metadata,
+            spotify_search=self.spotify_search,
+            domain_resolver=self.domain_resolver,
         )
-        youtube_user_playlist = YouTubeUserPlaylist(
-            search=youtube_search,
+
+    @cached_property
+    def youtube_user_playlist(self) -> YouTubeUserPlaylist:
+        return YouTubeUserPlaylist(
+            search=self.domain.youtube_search,
             clients=self.clients,
             core=self.core,
-            spotify_playlist_compiler=spotify_playlist_compiler,
+            spotify_playlist_compiler=self.spotify_playlist_compiler,
         )
 
-        return App(
-            downloader=downloader,
-            resolver=resolver,
-            spotify_playlist_modify=spotify_playlist_modify,
-            spotify_playlist_compiler=spotify_playlist_compiler,
-            youtube_user_playlist=youtube_user_playlist,
-            domain_resolver=domain_resolver,
-        )
+
+class Container:
+    def __init__(self):
+        self.__path = get_config_path() / ".bootstrapped"
+
+        secrets = SecretsManager()
+        environment_mode = secrets.read(key="environment_mode", alt="PRODUCTION")
+        basicConfig(level=INFO if environment_mode.lower() == "production" else DEBUG)
+
+        logger.debug("Bootstrapping app...")
+
+        self.initial_setup()
+
+        # components are built when first used, so a command only pays for
+        # the clients it touches
+        self.core = Core(secrets=secrets)
+        self.clients = Clients(secrets=secrets)
+        self.domain = Domain(core=self.core, clients=self.clients)
+        self.app = App(core=self.core, clients=self.clients, domain=self.domain)
+
+        logger.debug("Bootstrap complete. App ready for use.")
+
+    def initial_setup(self) -> None:
+        if not exists(self.__path):
+            logger.debug("Running initial setup...")
+            logger.debug("Creating internal files used for tracking downloads...")
+
+            # downloads history
+            logger.debug("Creating downloads history file...")
+            history = HistoryManager()
+            history.history_file_exists()
+            logger.debug("History file created.")
+
+            with open(self.__path, "w"):
+                pass
+
+            logger.debug("Download manager files setup complete.")
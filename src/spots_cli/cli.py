@@ -3,8 +3,7 @@ from logging import getLogger
 from typing import Callable
 import typer
 
-from spots_cli import setup_env, Spots
-from spots_cli.scripts import remove_duplicate_songs, update_history
+# commands import what they use, so `--help` and the scripts start fast
 
 logger = getLogger(__name__)
 
@@ -13,29 +12,61 @@ app = typer.Typer()
 
 @app.command()
 def setup():
+    from spots_cli import setup_env
+
     setup_env.main()
 
 
 @app.command()
-def download(query: str):
+def download(
+    query: str,
+    sync: bool = typer.Option(
+        False, "--sync", help="Only download tracks added since the last sync."
+    ),
+    prune: bool = typer.Option(
+        False,
+        "--prune",
+        help="With --sync, move songs removed from the playlist to the trash.",
+    ),
+):
+    from spots_cli import Spots
+
     app = Spots()
-    app.download(query)
+    app.download(query, sync=sync, prune=prune)
 
 
 @app.command()
-def migrate_likes():
+def migrate_likes(
+    retry_failed: bool = typer.Option(
+        False, "--retry-failed", help="Retry tracks that failed in earlier runs."
+    ),
+):
+    from spots_cli import Spots
+
     app = Spots()
-    app.transfer_spotify_likes()
+    app.transfer_spotify_likes(retry_failed=retry_failed)
 
 
 @app.command()
 def add_to_history(path_to_music: str):
+    from spots_cli.scripts import update_history
+
     update_history(path_to_music)
 
 
 @app.command()
-def remove_duplicates(path_to_music: str):
-    remove_duplicate_songs(path_to_music)
+def remove_duplicates(
+    path_to_music: str,
+    dry_run: bool = typer.Option(
+        False, "--dry-run", help="List the duplicates without removing them."
+    ),
+    delete: bool = typer.Option(
+        False, "--delete", help="Delete duplicates instead of moving them to trash."
+    ),
+):
+    from spots_cli.scripts import remove_duplicate_songs
+
+    remove_duplicate_songs(path_to_music, delete=delete, dry_run=dry_run)
 
 
 def main():
@@ -1,10 +1,6 @@
 from dotenv import load_dotenv
 from logging import getLogger
 from os import getenv
-from spotipy.exceptions import SpotifyException
-from spotipy.oauth2 import SpotifyClientCredentials
-from spotipy import Spotify
-from spotipy.util import prompt_for_user_token
 
 load_dotenv()
 
@@ -22,6 +18,8 @@ class SpotifyClient:
 
     def __init__(self) -> None:
         """Initializes a spotify.spotify"""
+        from spotipy import Spotify
+        from spotipy.oauth2 import SpotifyClientCredentials
 
         auth_manager = SpotifyClientCredentials()
         self.client = Spotify(auth_manager=auth_manager)
@@ -35,6 +33,8 @@ class SpotifyClient:
         if not getenv("username"):
             return None
 
+        from spotipy.exceptions import SpotifyException
+
         user = None
 
         try:
@@ -58,6 +58,10 @@ class SpotifyClient:
 
         scope = getenv("scope") or DEFAULT_USER_SCOPE
 
+        from spotipy import Spotify
+        from spotipy.exceptions import SpotifyException
+        from spotipy.util import prompt_for_user_token
+
         logger.info(f"Signing in to {username} on Spotify with scope: {scope}")
 
         try:
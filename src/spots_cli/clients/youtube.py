@@ -1,10 +1,8 @@
 import os
 import pickle
+from functools import cached_property
 from importlib.resources import files
 from os.path import exists
-from googleapiclient.discovery import build
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
 
 from spots_cli.utils import get_config_path
 
@@ -31,13 +29,16 @@ class YouTubeApiClient:
         """
         Initialize the YouTubeApiClient.
 
-        Sets up the api client.
+        Checks the client secrets; the api client is built on first use.
         """
         self.secrets_file = str(files("spots_cli.config").joinpath("client_secrets.json"))
         if not exists(self.secrets_file):
             raise RuntimeError("Provide path to cookies for YouTube account access.")
 
-        self.service = self._build_service()
+    @cached_property
+    def service(self):
+        """The YouTube api client, built once per instance."""
+        return self._build_service()
 
     def _build_service(self):
         """
@@ -46,6 +47,10 @@ class YouTubeApiClient:
         Returns:
             Unknown: YouTube client.
         """
+        from googleapiclient.discovery import build
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from google.auth.transport.requests import Request
+
         creds = None
         if os.path.exists(PICKLE_TOKEN):
             with open(PICKLE_TOKEN, "rb") as f:
@@ -63,4 +68,12 @@ class YouTubeApiClient:
             with open(PICKLE_TOKEN, "wb") as f:
                 pickle.dump(creds, f)
 
-        return build("youtube", "v3", credentials=creds)
+        # the discovery document bundled with googleapiclient is parsed locally,
+        # so no request is made and no discovery file cache is needed
+        return build(
+            "youtube",
+            "v3",
+            credentials=creds,
+            static_discovery=True,
+            cache_discovery=False,
+        )
@@ -1,25 +1,34 @@
 from __future__ import annotations
 
 from logging import getLogger
+from threading import local
 from typing import TYPE_CHECKING
-from yt_dlp import YoutubeDL
 
 from spots_cli.utils import get_config_path, detect_browser
 
 if TYPE_CHECKING:
-    from yt_dlp import _Params
+    from yt_dlp import YoutubeDL, _Params
     from spots_cli.clients import SecretsManager
 
 
 logger = getLogger(__name__)
 
 
+def youtube_dl(options: _Params) -> YoutubeDL:
+    """Builds a YoutubeDL, importing yt-dlp on first use."""
+    from yt_dlp import YoutubeDL
+
+    return YoutubeDL(options)
+
+
 class YtDlpClient:
     """
     A service for interacting with the YouTube DL library.
 
     Attributes:
         @ydl (YoutubeDL): YouTube DL client.
+        @flat_client (YoutubeDL): Client listing search and playlist entries without resolving their formats.
+        @thread_client (YoutubeDL): A client of the calling thread, for concurrent extractions.
         @video_to_mp3 (VideoToMp3Service): Service for post-video-downloaded processing.
         @directory_path (str, optional): The directory to save the audio. Defaults to ''.
 
@@ -27,6 +36,9 @@ class YtDlpClient:
         @download_youtube_video
     """
 
+    # list entries without extracting each one
+    FLAT_OPTIONS: _Params = {"extract_flat": "in_playlist"}
+
     def __init__(
         self,
         *,
@@ -56,7 +68,23 @@ class YtDlpClient:
             if cookies_path:
                 self.client_options["cookiefile"] = cookies_path
 
-        self.client = YoutubeDL(self.client_options)
+        # what `reset_options` goes back to, keeping the cookies
+        self.base_options: _Params = self.client_options.copy()
+
+        self.client = youtube_dl(self.client_options)
+        # the listing and thread clients keep the base options, only `client`
+        # follows `options`, which downloads set per song
+        self.flat_client = youtube_dl(self.base_options | self.FLAT_OPTIONS)
+        self._thread_clients = local()
+
+    @property
+    def thread_client(self) -> YoutubeDL:
+        """A YoutubeDL instance owned by the calling thread, as they are not thread safe."""
+        client = getattr(self._thread_clients, "client", None)
+        if client is None:
+            client = youtube_dl(self.base_options)
+            self._thread_clients.client = client
+        return client
 
     @property
     def options(self) -> _Params:
@@ -65,8 +93,8 @@ class YtDlpClient:
     @options.setter
     def options(self, extra_options: _Params) -> None:
         self.client_options = self.client_options | extra_options
-        self.client = YoutubeDL(self.client_options)
+        self.client = youtube_dl(self.client_options)
 
     def reset_options(self) -> None:
-        self.client_options = self.default_options
-        self.client = YoutubeDL(self.default_options)
+        self.client_options = self.base_options.copy()
+        self.client = youtube_dl(self.client_options)
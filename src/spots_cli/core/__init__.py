@@ -1,6 +1,8 @@
 from spots_cli.core.web_scraper import WebScraper
 from spots_cli.core.lyrics_finder import LyricsFinder
 from spots_cli.core.history_manager import HistoryManager
+from spots_cli.core.library_scanner import LibraryScanner, LibraryFile
+from spots_cli.core.duplicate_finder import DuplicateFinder, DuplicateGroup
 from spots_cli.core.pattern_matcher import PatternMatcher
 from spots_cli.core.video_converter import VideoConverter
 from spots_cli.core.youtube_extractor import YouTubeExtractor
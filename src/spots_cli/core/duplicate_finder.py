@@ -0,0 +1,276 @@
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from hashlib import blake2b
+from logging import getLogger
+from os import remove
+from os.path import abspath
+from typing import Callable, Hashable, Iterable, Optional, TypeVar
+
+from spots_cli.core.library_scanner import LibraryFile, LibraryScanner, move_to_trash
+
+logger = getLogger(__name__)
+
+T = TypeVar("T")
+
+ID3V2_HEADER_SIZE = 10
+ID3V1_TAG_SIZE = 128
+
+
+def synchsafe(data: bytes) -> int:
+    """Decodes an ID3v2 size, 7 bits per byte."""
+    size = 0
+    for byte in data:
+        size = (size << 7) | (byte & 0x7F)
+    return size
+
+
+def audio_span(path: str, size: int) -> tuple[int, int]:
+    """
+    The (offset, length) of the audio frames of an MP3, without its ID3v2
+    header and ID3v1 trailer, so retagged copies of a file share a span content.
+    """
+    with open(path, "rb") as file:
+        header = file.read(ID3V2_HEADER_SIZE)
+
+        start = 0
+        if len(header) == ID3V2_HEADER_SIZE and header[:3] == b"ID3":
+            start = ID3V2_HEADER_SIZE + synchsafe(header[6:10])
+            # footer present
+            if header[5] & 0x10:
+                start += ID3V2_HEADER_SIZE
+
+        end = size
+        if size - start >= ID3V1_TAG_SIZE:
+            file.seek(size - ID3V1_TAG_SIZE)
+            if file.read(3) == b"TAG":
+                end -= ID3V1_TAG_SIZE
+
+    return start, max(end - start, 0)
+
+
+def hash_span(path: str, offset: int, length: int, chunk_size: int) -> str:
+    """Hashes `length` bytes of a file from `offset`, reading one chunk at a time."""
+    digest = blake2b(digest_size=16)
+    with open(path, "rb") as file:
+        file.seek(offset)
+        while length > 0:
+            chunk = file.read(min(chunk_size, length))
+            if not chunk:
+                break
+            digest.update(chunk)
+            length -= len(chunk)
+
+    return digest.hexdigest()
+
+
+def read_bitrate(path: str) -> int:
+    """The bitrate of an MP3 in bps, 0 if it can't be read."""
+    from mutagen import MutagenError
+    from mutagen.mp3 import MP3
+
+    try:
+        return MP3(path).info.bitrate
+    except (MutagenError, OSError):
+        return 0
+
+
+def normalize_song_name(song_name: str) -> str:
+    return " ".join(song_name.casefold().split())
+
+
+@dataclass
+class DuplicateGroup:
+    """Copies of the same song, and the one to keep."""
+
+    keeper: LibraryFile
+    duplicates: list[LibraryFile] = field(default_factory=list)
+
+
+class DuplicateFinder:
+    """
+    Finds duplicate songs in a music folder.
+
+    Files are duplicates when they have the same artist and title tags, or the
+    same audio content. Contents are only compared between files whose audio
+    has the same length, first on a prefix, then on the full audio, so most
+    files are never hashed. The copy with the highest bitrate, then the
+    largest size, is kept.
+
+    Methods:
+        @find
+        @remove
+    """
+
+    WORKERS = 8
+
+    # bytes of audio hashed before hashing whole files
+    PREFIX_BYTES = 64 * 1024
+
+    # bytes read at once while hashing
+    CHUNK_BYTES = 1024 * 1024
+
+    def __init__(
+        self,
+        *,
+        scanner: Optional[LibraryScanner] = None,
+        workers: Optional[int] = None,
+    ):
+        self.workers = workers or self.WORKERS
+        self.scanner = scanner or LibraryScanner(workers=self.workers)
+
+    def _map(self, function: Callable[..., T], items: Iterable[tuple]) -> list[T]:
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return list(executor.map(lambda args: function(*args), items))
+
+    def _content_groups(self, files: list[LibraryFile]) -> list[list[int]]:
+        """Groups of indexes of `files` with the same audio content."""
+        spans = self._map(self._safe_span, ((file,) for file in files))
+
+        by_length: dict[int, list[int]] = defaultdict(list)
+        for index, span in enumerate(spans):
+            if span and span[1]:
+                by_length[span[1]].append(index)
+
+        candidates = [group for group in by_length.values() if len(group) > 1]
+
+        for limit in (self.PREFIX_BYTES, None):
+            indexes = [index for group in candidates for index in group]
+            digests = self._map(
+                lambda index: hash_span(
+                    files[index].path,
+                    spans[index][0],
+                    spans[index][1] if limit is None else min(limit, spans[index][1]),
+                    self.CHUNK_BYTES,
+                ),
+                ((index,) for index in indexes),
+            )
+            digest_of = dict(zip(indexes, digests))
+
+            candidates = [
+                subgroup
+                for group in candidates
+                for subgroup in self._split(group, key=digest_of.__getitem__)
+            ]
+
+        return candidates
+
+    @staticmethod
+    def _safe_span(file: LibraryFile) -> Optional[tuple[int, int]]:
+        try:
+            return audio_span(file.path, file.size)
+        except OSError as e:
+            logger.warning(f"Skipping {file.path}: {e}")
+            return None
+
+    @staticmethod
+    def _split(indexes: list[int], key: Callable[[int], Hashable]) -> list[list[int]]:
+        """Splits `indexes` by `key`, keeping the parts with more than one index."""
+        parts: dict[Hashable, list[int]] = defaultdict(list)
+        for index in indexes:
+            parts[key(index)].append(index)
+        return [part for part in parts.values() if len(part) > 1]
+
+    def find(self, folder: str) -> list[DuplicateGroup]:
+        """
+        Finds the groups of duplicate songs under `folder`.
+
+        Args:
+            folder (str): The music folder.
+
+        Returns:
+            list[DuplicateGroup]: The groups with more than one file.
+        """
+        files = sorted(self.scanner.scan(folder), key=lambda file: file.path)
+
+        # union find over the indexes of `files`
+        parents = list(range(len(files)))
+
+        def root(index: int) -> int:
+            while parents[index] != index:
+                parents[index] = parents[parents[index]]
+                index = parents[index]
+            return index
+
+        def join_group(indexes: list[int]):
+            first = root(indexes[0])
+            for index in indexes[1:]:
+                parents[root(index)] = first
+
+        tagged = [index for index, file in enumerate(files) if file.title]
+        for group in self._split(
+            tagged, key=lambda index: normalize_song_name(files[index].song_name)
+        ):
+            join_group(group)
+
+        for group in self._content_groups(files):
+            join_group(group)
+
+        members: dict[int, list[int]] = defaultdict(list)
+        for index in range(len(files)):
+            members[root(index)].append(index)
+
+        duplicates = [group for group in members.values() if len(group) > 1]
+        indexes = [index for group in duplicates for index in group]
+        bitrates = dict(
+            zip(
+                indexes,
+                self._map(read_bitrate, ((files[index].path,) for index in indexes)),
+            )
+        )
+
+        groups: list[DuplicateGroup] = []
+        for group in duplicates:
+            ranked = sorted(
+                group, key=lambda index: (-bitrates[index], -files[index].size, index)
+            )
+            groups.append(
+                DuplicateGroup(
+                    keeper=files[ranked[0]],
+                    duplicates=[files[index] for index in ranked[1:]],
+                )
+            )
+
+        logger.info(f"Found {len(groups)} songs with duplicates in {len(files)} files")
+        return groups
+
+    def remove(
+        self,
+        groups: list[DuplicateGroup],
+        *,
+        folder: str,
+        delete: bool = False,
+        dry_run: bool = False,
+    ) -> list[str]:
+        """
+        Removes the duplicates of each group.
+
+        Args:
+            groups (list[DuplicateGroup]): Groups returned by `find`.
+            folder (str): The music folder the groups were found in.
+            delete (bool, optional): Delete the files instead of moving them to
+                the trash folder inside `folder`. Defaults to False.
+            dry_run (bool, optional): Only list the files. Defaults to False.
+
+        Returns:
+            list[str]: The paths of the files removed, or that would be removed.
+                Files that can't be removed are logged and left out.
+        """
+        folder = abspath(folder)
+        removed: list[str] = []
+
+        for group in groups:
+            for duplicate in group.duplicates:
+                if not dry_run:
+                    try:
+                        if delete:
+                            remove(duplicate.path)
+                        else:
+                            move_to_trash(duplicate.path, folder=folder)
+                    except OSError as e:
+                        logger.warning(f"Skipping {duplicate.path}: {e}")
+                        continue
+
+                removed.append(duplicate.path)
+
+        return removed
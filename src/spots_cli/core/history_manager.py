@@ -1,4 +1,5 @@
 from os import path
+from typing import Iterable
 
 from spots_cli.utils import get_config_path
 
@@ -37,3 +38,34 @@ class HistoryManager:
         """
         with open(self.__history_file, "a", newline="") as file:
             file.write(f"{title}\n")
+
+    def titles(self) -> list[str]:
+        """All the titles in history"""
+        try:
+            with open(self.__history_file, "r") as file:
+                return [title for title in file.read().split("\n") if title]
+        except FileNotFoundError:
+            return []
+
+    def write_many(self, titles: Iterable[str]) -> int:
+        """Adds the titles not in history yet, in one write
+
+        Args:
+            titles (Iterable[str]): The titles to be added.
+
+        Returns:
+            int: The number of titles added.
+        """
+        history = set(self.titles())
+
+        new_titles = []
+        for title in titles:
+            if title and title not in history:
+                history.add(title)
+                new_titles.append(title)
+
+        if new_titles:
+            with open(self.__history_file, "a", newline="") as file:
+                file.write("".join(f"{title}\n" for title in new_titles))
+
+        return len(new_titles)
@@ -0,0 +1,190 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from json import JSONDecodeError, dump, load
+from logging import getLogger
+from os import makedirs, replace, scandir, sep
+from os.path import abspath, dirname, exists, join, relpath, splitext
+from shutil import move
+from typing import Iterator, Optional
+
+from spots_cli.utils import get_config_path
+
+logger = getLogger(__name__)
+
+# where removed songs are moved, inside the music folder
+TRASH_DIR = ".spots-trash"
+
+
+def move_to_trash(path: str, *, folder: str) -> str:
+    """
+    Moves a file of `folder` to its trash folder, keeping its relative path and
+    numbering copies of a name already in the trash.
+
+    Returns:
+        str: The path of the file in the trash.
+    """
+    folder = abspath(folder)
+    target = join(folder, TRASH_DIR, relpath(abspath(path), folder))
+    makedirs(dirname(target), exist_ok=True)
+
+    stem, extension = splitext(target)
+    copy = 1
+    while exists(target):
+        target = f"{stem} ({copy}){extension}"
+        copy += 1
+
+    move(path, target)
+    return target
+
+
+@dataclass(frozen=True)
+class LibraryFile:
+    """An audio file of the music folder and its tags."""
+
+    path: str
+    mtime: int
+    size: int
+    artist: str = ""
+    title: str = ""
+
+    @property
+    def song_name(self) -> str:
+        """The name used in the downloads history, `Artist - Title`, or empty."""
+        if not self.title:
+            return ""
+        return f"{self.artist} - {self.title}" if self.artist else self.title
+
+
+def walk_files(
+    folder: str, extensions: tuple[str, ...], skip_dirs: tuple[str, ...] = ()
+) -> Iterator[tuple[str, int, int]]:
+    """
+    Yields the (path, mtime in ns, size) of the files under `folder` with one of
+    `extensions`, walking the tree iteratively with `scandir`. Directories
+    named in `skip_dirs` are not entered.
+    """
+    directories = [folder]
+    while directories:
+        directory = directories.pop()
+        try:
+            entries = scandir(directory)
+        except OSError as e:
+            logger.warning(f"Skipping {directory}: {e}")
+            continue
+
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in skip_dirs:
+                        directories.append(entry.path)
+                elif entry.name.lower().endswith(extensions):
+                    stat = entry.stat()
+                    yield entry.path, stat.st_mtime_ns, stat.st_size
+
+
+def read_tags(path: str, mtime: int, size: int) -> LibraryFile:
+    """Reads the artist and title of a file from its ID3 tag only."""
+    from mutagen import MutagenError
+    from mutagen.id3 import ID3
+
+    try:
+        tags = ID3(path)
+    except (MutagenError, OSError):
+        return LibraryFile(path=path, mtime=mtime, size=size)
+
+    return LibraryFile(
+        path=path,
+        mtime=mtime,
+        size=size,
+        artist=str(tags.get("TPE1", "")),
+        title=str(tags.get("TIT2", "")),
+    )
+
+
+class LibraryScanner:
+    """
+    Scans a music folder, reading the tags of each file.
+
+    A manifest of the files seen, with their modification time, size and tags,
+    is persisted between scans, so a re-scan only reads the files that changed.
+
+    Methods:
+        @scan
+    """
+
+    EXTENSIONS = (".mp3",)
+
+    SKIP_DIRS = (TRASH_DIR,)
+
+    # tag reads are mostly waiting on the disk
+    WORKERS = 8
+
+    def __init__(self, *, workers: Optional[int] = None):
+        self.workers = workers or self.WORKERS
+        self.__manifest_path = get_config_path() / ".library_manifest.json"
+        self.__manifest: dict[str, LibraryFile] = {}
+        self.reload()
+
+    def reload(self) -> None:
+        try:
+            with open(self.__manifest_path, "r", encoding="utf-8") as file:
+                records = load(file)
+        except (FileNotFoundError, JSONDecodeError):
+            return
+
+        self.__manifest = {
+            record["path"]: LibraryFile(**record) for record in records.values()
+        }
+
+    def save(self) -> None:
+        """Writes the manifest to a temporary file, then swaps it in."""
+        temp_path = self.__manifest_path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as file:
+            dump({path: asdict(item) for path, item in self.__manifest.items()}, file)
+
+        replace(temp_path, self.__manifest_path)
+
+    def scan(self, folder: str) -> list[LibraryFile]:
+        """
+        Lists the audio files under `folder` with their tags.
+
+        Files whose modification time and size are unchanged since the last
+        scan reuse the manifest; the others are read concurrently.
+
+        Args:
+            folder (str): The music folder.
+
+        Returns:
+            list[LibraryFile]: The files found, tagged or not.
+        """
+        folder = abspath(folder)
+        found = list(walk_files(folder, self.EXTENSIONS, self.SKIP_DIRS))
+
+        files: list[LibraryFile] = []
+        changed: list[tuple[str, int, int]] = []
+        for path, mtime, size in found:
+            known = self.__manifest.get(path)
+            if known and known.mtime == mtime and known.size == size:
+                files.append(known)
+            else:
+                changed.append((path, mtime, size))
+
+        logger.info(
+            f"Scanned {len(found)} files, reading tags of {len(changed)} changed ones"
+        )
+
+        if changed:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                files.extend(executor.map(lambda args: read_tags(*args), changed))
+
+        # files removed from the folder since the last scan
+        prefix = folder.rstrip(sep) + sep
+        seen = {file.path for file in files}
+        for path in [path for path in self.__manifest if path.startswith(prefix)]:
+            if path not in seen:
+                del self.__manifest[path]
+
+        self.__manifest.update((file.path, file) for file in files)
+        self.save()
+
+        return files
@@ -1,33 +1,204 @@
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property
 from logging import getLogger
-from lyricsgenius import Genius
-from typing import TYPE_CHECKING
+from threading import Lock
+from time import time
+from typing import TYPE_CHECKING, Callable, Optional, Sequence
+
+from spots_cli.engine import song_key
+from spots_cli.models import LyricsRecord
 
 if TYPE_CHECKING:
+    from lyricsgenius import Genius
     from spots_cli.clients import SecretsManager
     from spots_cli.core import WebScraper
+    from spots_cli.engine import FileStorage
+    from spots_cli.models import Metadata
 
 
 logger = getLogger(__name__)
 
 
+def lyrics_key(*, artist: str, title: str) -> str:
+    """
+    Builds the cache key of a song, so spelling variants share one entry.
+
+    Shares `song_key`, which only folds Latin-script accents, so titles that
+    differ by a kana voicing mark or an Indic vowel sign keep their own entry.
+
+    >>> lyrics_key(artist="", title="ばか") == lyrics_key(artist="", title="はか")
+    False
+    >>> lyrics_key(artist="Beyoncé", title="Halo")
+    'beyonce halo'
+    """
+    return song_key(artist, title)
+
+
+class LyricsPrefetch:
+    """
+    Fetches lyrics in the background for the next few songs of a download queue.
+
+    Only `ahead` songs past the one downloading are submitted, so songs that
+    are never reached cost nothing. Closing it cancels the lookups not started
+    and waits for the running ones, so their results are cached before the
+    caller saves the cache.
+
+    Methods:
+        @advance
+        @close
+    """
+
+    def __init__(
+        self,
+        *,
+        finder: LyricsFinder,
+        queue: Sequence[Metadata],
+        skip: Optional[Callable[[Metadata], bool]] = None,
+        ahead: int,
+    ):
+        self.finder = finder
+        self.queue = queue
+        self.skip = skip
+        self.ahead = ahead
+        self._next = 0
+        self._keys: list[str] = []
+        self._executor = ThreadPoolExecutor(
+            max_workers=finder.PREFETCH_WORKERS, thread_name_prefix="lyrics"
+        )
+
+    def __enter__(self) -> LyricsPrefetch:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def advance(self, position: int) -> None:
+        """Submits the songs up to `ahead` past `position`, the song downloading."""
+        end = min(position + 1 + self.ahead, len(self.queue))
+        while self._next < end:
+            metadata = self.queue[self._next]
+            self._next += 1
+
+            if metadata.lyrics or (self.skip and self.skip(metadata)):
+                continue
+
+            key = self.finder.submit(self._executor, metadata)
+            if key:
+                self._keys.append(key)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self.finder.forget(self._keys)
+        self._keys = []
+
+
 class LyricsFinder:
     """
     A service for retrieving lyrics for a song
 
     Args:
         scraper (WebScrapeService): The web scraper client.
+        storage (FileStorage): The cache for lyrics lookups.
 
     Attributes:
         genius: Genius api client.
     """
 
-    def __init__(self, *, scraper: WebScraper, secrets_manager: SecretsManager):
+    PREFETCH_WORKERS = 2
+    # songs fetched ahead of the one downloading
+    PREFETCH_AHEAD = 4
+    # songs without lyrics are looked up again after a week
+    NEGATIVE_TTL = 7 * 24 * 60 * 60
+
+    def __init__(
+        self,
+        *,
+        scraper: WebScraper,
+        secrets_manager: SecretsManager,
+        storage: FileStorage,
+    ):
         self.secrets_manager = secrets_manager
         self.scraper = scraper
+        self.storage = storage
+
+        self._pending: dict[str, Future[str]] = {}
+        self._lock = Lock()
+
+    @cached_property
+    def genius(self) -> Genius | None:
+        """The Genius client, built on the first lookup."""
         genius_key = self.secrets_manager.read(key="lyricsgenius_key")
-        self.genius = Genius(genius_key) if genius_key else None
+        if not genius_key:
+            return None
+
+        from lyricsgenius import Genius
+
+        return Genius(genius_key)
+
+    def prefetch(
+        self,
+        metadata_list: Sequence[Metadata],
+        *,
+        skip: Optional[Callable[[Metadata], bool]] = None,
+    ) -> LyricsPrefetch:
+        """Fetches lyrics in the background while the queued songs download.
+
+        Call `advance` with the position of each song as it downloads, and close
+        the prefetch, or use it as a context manager, once the queue is done.
+
+        Args:
+            metadata_list (Sequence[Metadata]): The queued songs, in download order.
+            skip (Callable[[Metadata], bool], optional): Songs that won't be downloaded, such as owned ones.
+        """
+        return LyricsPrefetch(
+            finder=self, queue=metadata_list, skip=skip, ahead=self.PREFETCH_AHEAD
+        )
+
+    def submit(self, executor: ThreadPoolExecutor, metadata: Metadata) -> str | None:
+        """Starts a lookup on `executor`, returns its key unless one is running already."""
+        key = lyrics_key(artist=metadata.artist, title=metadata.title)
+        with self._lock:
+            if key in self._pending:
+                return None
+
+            self._pending[key] = executor.submit(
+                self.get_lyrics, artist=metadata.artist, title=metadata.title
+            )
+        return key
+
+    def forget(self, keys: list[str]) -> None:
+        """Drops the lookups of a closed prefetch, their results are cached."""
+        with self._lock:
+            for key in keys:
+                self._pending.pop(key, None)
+
+    def resolve(self, metadata: Metadata) -> str:
+        """Returns the lyrics of a song, fetching them if they are not resolved yet.
+
+        Uses the result of a background prefetch when one was started.
+
+        Args:
+            metadata (Metadata): The song. It is left as is: it may be shared with
+                the metadata cache, and lyrics are kept in their own cache.
+
+        Returns:
+            str: The lyrics if found, else an empty string.
+        """
+        if metadata.lyrics:
+            return metadata.lyrics
+
+        with self._lock:
+            pending = self._pending.pop(
+                lyrics_key(artist=metadata.artist, title=metadata.title), None
+            )
+
+        # cancelled when the prefetch it came from was closed
+        if pending is not None and not pending.cancelled():
+            return pending.result()
+
+        return self.get_lyrics(artist=metadata.artist, title=metadata.title)
 
     def get_lyrics(self, *, artist: str, title: str) -> str:
         """Retrieve lyrics using Genius. Falls back to using alternatives provided by the scraper.
@@ -39,6 +210,12 @@ class LyricsFinder:
         Returns:
             str: The lyrics if found, else an empty string.
         """
+        key = lyrics_key(artist=artist, title=title)
+        cache = self.storage.get(query=key, query_type="lyrics")
+        if cache and (cache.lyrics or time() - cache.fetched_at < self.NEGATIVE_TTL):
+            logger.debug(f"Lyrics cache hit: {key}")
+            return cache.lyrics
+
         try:
             if self.genius:
                 logger.debug("Searching for lyrics on Genius")
@@ -53,6 +230,13 @@ class LyricsFinder:
                 logger.debug("Genius API not available. Falling back to AZLyrics")
                 lyrics = self.scraper.scrape_azlyrics(artist=artist, title=title)
         except Exception as e:
+            # transient failure, don't cache it
             logger.error(e)
-            lyrics = ""
+            return ""
+
+        self.storage.new(
+            query=key,
+            result=LyricsRecord(lyrics=lyrics, fetched_at=time()),
+            query_type="lyrics",
+        )
         return lyrics
@@ -1,13 +1,18 @@
 from __future__ import unicode_literals, annotations
 
-from logging import getLogger
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import lru_cache
+from logging import DEBUG, getLogger
 from re import compile, sub, IGNORECASE, VERBOSE
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable, Literal, Sequence
+from unicodedata import combining, normalize
 
-from spots_cli.engine import storage
-from spots_cli.models import SongNotFound, Sentinel, YTVideoInfo, Metadata
+from spots_cli.models import YTVideoInfo, Metadata
 
 if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
     from spots_cli.core import YouTubeExtractor
 
 # -----------------------------
@@ -52,6 +57,9 @@ STOPWORDS = {
     "topic",
 }
 
+# auto-generated channels hosting the studio recordings
+TOPIC_SUFFIX = " - Topic"
+
 BAD_UPLOADER_KEYWORDS = {
     "karaoke",
     "lyrics",
@@ -68,40 +76,52 @@ BAD_UPLOADER_KEYWORDS = {
 # helpers
 # -----------------------------
 
+# the same titles and uploaders are tokenized over and over while matching
+TOKEN_CACHE_SIZE = 8192
+
 
 def strip_features(text: str) -> str:
     cleaned = sub(FEAT_PATTERN, "", text)
-    logger.debug("strip_features: '%s' -> '%s'", text, cleaned)
+
+    if logger.isEnabledFor(DEBUG):
+        logger.debug("strip_features: '%s' -> '%s'", text, cleaned)
+
     return cleaned
 
 
-def tokenize(text: str) -> set[str]:
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def tokenize(text: str) -> frozenset[str]:
     original = text
     text = text.lower()
     text = strip_features(text)
     tokens = NON_WORD_PATTERN.sub(" ", text).split()
-    filtered = {t for t in tokens if t not in STOPWORDS}
+    filtered = frozenset(t for t in tokens if t not in STOPWORDS)
 
-    logger.debug(
-        "tokenize: original='%s', tokens=%s, filtered=%s",
-        original,
-        tokens,
-        filtered,
-    )
+    if logger.isEnabledFor(DEBUG):
+        logger.debug(
+            "tokenize: original='%s', tokens=%s, filtered=%s",
+            original,
+            tokens,
+            filtered,
+        )
 
     return filtered
 
 
-def token_similarity(a: set[str], b: set[str]) -> float:
+def token_similarity(a: frozenset[str], b: frozenset[str]) -> float:
     if not a or not b:
         logger.debug("token_similarity: empty tokens -> 0.0")
         return 0.0
 
     score = len(a & b) / max(len(a), len(b))
-    logger.debug("token_similarity: %s vs %s -> %.3f", a, b, score)
+
+    if logger.isEnabledFor(DEBUG):
+        logger.debug("token_similarity: %s vs %s -> %.3f", a, b, score)
+
     return score
 
 
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
 def uploader_penalty(uploader: str) -> float:
     uploader_lower = uploader.lower()
     penalty = 0.35 if any(k in uploader_lower for k in BAD_UPLOADER_KEYWORDS) else 0.0
@@ -110,21 +130,295 @@ def uploader_penalty(uploader: str) -> float:
     return penalty
 
 
+def artist_tokens_in_title_or_uploader(
+    sp_tokens: frozenset[str],
+    yt_title_tokens: frozenset[str],
+    yt_uploader_tokens: frozenset[str],
+) -> bool:
+    result = not sp_tokens.isdisjoint(yt_title_tokens) or not sp_tokens.isdisjoint(
+        yt_uploader_tokens
+    )
+
+    if logger.isEnabledFor(DEBUG):
+        logger.debug(
+            "artist_in_title_or_uploader: sp=%s, yt=%s -> %s",
+            sp_tokens,
+            yt_title_tokens | yt_uploader_tokens,
+            result,
+        )
+
+    return result
+
+
 def artist_in_title_or_uploader(
     sp_artist: str, yt_title: str, yt_uploader: str
 ) -> bool:
-    sp_tokens = tokenize(sp_artist)
-    yt_tokens = tokenize(yt_title) | tokenize(yt_uploader)
-    result = bool(sp_tokens & yt_tokens)
-
-    logger.debug(
-        "artist_in_title_or_uploader: sp=%s, yt=%s -> %s",
-        sp_tokens,
-        yt_tokens,
-        result,
+    return artist_tokens_in_title_or_uploader(
+        tokenize(sp_artist), tokenize(yt_title), tokenize(yt_uploader)
     )
 
-    return result
+
+# -----------------------------
+# scorers
+# -----------------------------
+
+# abbreviations that tokenize keeps as distinct words
+TOKEN_ALIASES = {
+    "pt": "part",
+    "vol": "volume",
+    "n": "and",
+    "w": "with",
+}
+
+
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def fold_token(token: str) -> str:
+    """Strips accents and expands known abbreviations of a token."""
+    folded = "".join(c for c in normalize("NFKD", token) if not combining(c))
+    return TOKEN_ALIASES.get(folded, folded)
+
+
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def trigrams(token: str) -> frozenset[str]:
+    """The character trigrams of a token, padded so short tokens have some."""
+    padded = f" {token} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+def jaro_winkler(a: str, b: str, prefix_scale: float = 0.1) -> float:
+    if a == b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+
+    window = max(0, max(len(a), len(b)) // 2 - 1)
+    a_matched = [False] * len(a)
+    b_matched = [False] * len(b)
+
+    matches = 0
+    for i, char in enumerate(a):
+        for j in range(max(0, i - window), min(len(b), i + window + 1)):
+            if not b_matched[j] and b[j] == char:
+                a_matched[i] = b_matched[j] = True
+                matches += 1
+                break
+
+    if not matches:
+        return 0.0
+
+    a_chars = [c for c, m in zip(a, a_matched) if m]
+    b_chars = [c for c, m in zip(b, b_matched) if m]
+    transpositions = sum(x != y for x, y in zip(a_chars, b_chars)) // 2
+
+    jaro = (
+        matches / len(a) + matches / len(b) + (matches - transpositions) / matches
+    ) / 3
+
+    prefix = 0
+    for x, y in zip(a[:4], b[:4]):
+        if x != y:
+            break
+        prefix += 1
+
+    return jaro + prefix * prefix_scale * (1 - jaro)
+
+
+class Scorer(ABC):
+    """Scores how similar two token sets are, from 0 to 1."""
+
+    @abstractmethod
+    def similarity(self, a: frozenset[str], b: frozenset[str]) -> float:
+        pass
+
+
+class TokenSetScorer(Scorer):
+    """Exact token overlap. Tokens differing by a single character do not count."""
+
+    def similarity(self, a: frozenset[str], b: frozenset[str]) -> float:
+        return token_similarity(a, b)
+
+
+class FuzzyTokenScorer(Scorer):
+    """
+    Token overlap where near-identical tokens earn partial credit.
+
+    Tokens are accent-folded and abbreviations expanded before comparison, so
+    `beyoncé` equals `beyonce` and `pt` equals `part`. Each token of the smaller
+    set is credited with its best similarity in the other set, when that
+    similarity reaches `TOKEN_THRESHOLD`.
+    """
+
+    TOKEN_THRESHOLD = 0.80
+
+    def __init__(self):
+        self._token_similarity = lru_cache(maxsize=TOKEN_CACHE_SIZE)(
+            self.token_similarity
+        )
+
+    @abstractmethod
+    def token_similarity(self, a: str, b: str) -> float:
+        pass
+
+    def similarity(self, a: frozenset[str], b: frozenset[str]) -> float:
+        if not a or not b:
+            return 0.0
+
+        smaller, larger = (a, b) if len(a) <= len(b) else (b, a)
+        larger_folded = {fold_token(token) for token in larger}
+
+        overlap = 0.0
+        for token in smaller:
+            folded = fold_token(token)
+            if folded in larger_folded:
+                overlap += 1.0
+                continue
+
+            best = max(self._token_similarity(folded, other) for other in larger_folded)
+            if best >= self.TOKEN_THRESHOLD:
+                overlap += best
+
+        score = overlap / len(larger)
+
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("fuzzy_similarity: %s vs %s -> %.3f", a, b, score)
+
+        return score
+
+
+class TrigramScorer(FuzzyTokenScorer):
+    """Compares tokens by the Dice coefficient of their character trigrams."""
+
+    TOKEN_THRESHOLD = 0.70
+
+    def token_similarity(self, a: str, b: str) -> float:
+        a_grams, b_grams = trigrams(a), trigrams(b)
+        return 2 * len(a_grams & b_grams) / (len(a_grams) + len(b_grams))
+
+
+class JaroWinklerScorer(FuzzyTokenScorer):
+    """Compares tokens by Jaro-Winkler similarity, forgiving typos near the end."""
+
+    TOKEN_THRESHOLD = 0.90
+
+    def token_similarity(self, a: str, b: str) -> float:
+        return jaro_winkler(a, b)
+
+
+SCORERS: dict[str, type[Scorer]] = {
+    "token": TokenSetScorer,
+    "trigram": TrigramScorer,
+    "jaro_winkler": JaroWinklerScorer,
+}
+
+
+def make_scorer(name: str) -> Scorer:
+    """
+    Builds a scorer by its config name: `token`, `trigram` or `jaro_winkler`.
+
+    Unknown names fall back to `token`.
+    """
+    scorer = SCORERS.get(name.lower())
+    if scorer is None:
+        logger.warning("Unknown match scorer '%s', using 'token'", name)
+        scorer = TokenSetScorer
+
+    return scorer()
+
+
+# -----------------------------
+# batch scoring
+# -----------------------------
+
+
+@dataclass
+class BatchScores:
+    """
+    Scores of a batch of candidates against one track.
+
+    Args:
+        title (NDArray[np.float64]): The title similarity of each candidate.
+        artist (NDArray[np.float64]): The artist similarity of each candidate.
+        penalty (NDArray[np.float64]): The uploader penalty of each candidate.
+        final (NDArray[np.float64]): The weighted score of each candidate.
+        rank (NDArray[np.float64]): The final score plus the duration and topic bonuses.
+        matches (NDArray[np.bool_]): Whether each candidate passes `match_tracks`.
+        ranking (NDArray[np.intp]): Candidate indices, best rank score first.
+    """
+
+    title: NDArray[np.float64]
+    artist: NDArray[np.float64]
+    penalty: NDArray[np.float64]
+    final: NDArray[np.float64]
+    rank: NDArray[np.float64]
+    matches: NDArray[np.bool_]
+    ranking: NDArray[np.intp]
+
+    @property
+    def best(self) -> int | None:
+        """The index of the highest ranked matching candidate, if any."""
+        matching = self.ranking[self.matches[self.ranking]]
+        return int(matching[0]) if len(matching) else None
+
+
+def token_rows(
+    token_sets: Sequence[frozenset[str]], vocabulary: dict[str, int]
+) -> tuple[NDArray[np.intp], NDArray[np.intp]]:
+    """
+    Encodes token sets as sparse bag-of-token rows over a shared vocabulary.
+
+    Unknown tokens are added to `vocabulary`.
+
+    Returns:
+        tuple[NDArray[np.intp], NDArray[np.intp]]: The CSR `indptr` and `indices` arrays.
+    """
+    import numpy as np
+
+    indptr = np.zeros(len(token_sets) + 1, dtype=np.intp)
+    np.cumsum([len(tokens) for tokens in token_sets], out=indptr[1:])
+
+    indices = np.fromiter(
+        (
+            vocabulary.setdefault(token, len(vocabulary))
+            for tokens in token_sets
+            for token in tokens
+        ),
+        dtype=np.intp,
+        count=int(indptr[-1]),
+    )
+
+    return indptr, indices
+
+
+def row_overlap(
+    indptr: NDArray[np.intp], indices: NDArray[np.intp], mask: NDArray[np.bool_]
+) -> NDArray[np.intp]:
+    """Counts, for each sparse row, the tokens set in `mask`."""
+    import numpy as np
+
+    hits = np.zeros(len(indices) + 1, dtype=np.intp)
+    np.cumsum(mask[indices], out=hits[1:])
+    return hits[indptr[1:]] - hits[indptr[:-1]]
+
+
+def batch_similarity(
+    indptr: NDArray[np.intp],
+    indices: NDArray[np.intp],
+    reference: frozenset[str],
+    mask: NDArray[np.bool_],
+) -> NDArray[np.float64]:
+    """Vectorized `token_similarity` of every sparse row against `reference`."""
+    import numpy as np
+
+    sizes = np.diff(indptr)
+    if not reference:
+        return np.zeros(len(sizes), dtype=np.float64)
+
+    return np.divide(
+        row_overlap(indptr, indices, mask),
+        np.maximum(sizes, len(reference)),
+        out=np.zeros(len(sizes), dtype=np.float64),
+        where=sizes > 0,
+    )
 
 
 # -----------------------------
@@ -132,28 +426,71 @@ def artist_in_title_or_uploader(
 # -----------------------------
 
 
+MatchMode = Literal["first", "best"]
+
+
 class PatternMatcher:
     TITLE_THRESHOLD = 0.50
     ARTIST_THRESHOLD = 0.40
     FINAL_THRESHOLD = 0.60
 
-    def __init__(self, *, extractor: YouTubeExtractor):
+    # ranking mode signals
+    DURATION_WEIGHT = 0.10
+    DURATION_WINDOW = 30  # seconds off the track length that still earn a bonus
+    TOPIC_BONUS = 0.05
+    NEAR_PERFECT_SCORE = 0.95
+
+    # pre-filter: candidates further than this off the track length are pruned
+    PREFILTER_MIN_DURATION_OFFSET = 60  # seconds
+    PREFILTER_DURATION_RATIO = 0.5
+
+    def __init__(
+        self,
+        *,
+        extractor: YouTubeExtractor,
+        mode: MatchMode = "best",
+        scorer: Scorer | None = None,
+        blocked_channels: Iterable[str] = (),
+    ):
+        """
+        Args:
+            extractor (YouTubeExtractor): Cleans up artist and title of search results.
+            mode (MatchMode, optional): `first` picks the first matching search result,
+                `best` ranks every result and picks the highest score. Defaults to `best`.
+            scorer (Scorer | None, optional): Scores title and artist similarity.
+                Defaults to exact token overlap.
+            blocked_channels (Iterable[str], optional): Ids of the channels whose
+                uploads are never the original recording, such as karaoke or
+                nightcore channels. Defaults to none.
+        """
         self.extractor = extractor
+        self.mode = mode
+        self.scorer = scorer or TokenSetScorer()
+        self.blocked_channels = frozenset(blocked_channels)
 
     def match_tracks(self, *, video_info: YTVideoInfo, metadata: Metadata) -> bool:
+        return self._evaluate(video_info=video_info, metadata=metadata)[1]
+
+    def _evaluate(
+        self, *, video_info: YTVideoInfo, metadata: Metadata
+    ) -> tuple[float, bool]:
+        """Returns the final score of a video and whether it matches the track."""
         yt_artist = video_info.uploader or ""
         yt_title = video_info.title or ""
 
         sp_artist = metadata.artist or ""
         sp_title = metadata.title or ""
 
-        logger.debug(
-            "Matching track: YT(title='%s', uploader='%s') vs SP(title='%s', artist='%s')",
-            yt_title,
-            yt_artist,
-            sp_title,
-            sp_artist,
-        )
+        debug = logger.isEnabledFor(DEBUG)
+
+        if debug:
+            logger.debug(
+                "Matching track: YT(title='%s', uploader='%s') vs SP(title='%s', artist='%s')",
+                yt_title,
+                yt_artist,
+                sp_title,
+                sp_artist,
+            )
 
         yt_title_tokens = tokenize(yt_title)
         sp_title_tokens = tokenize(sp_title)
@@ -161,23 +498,27 @@ class PatternMatcher:
         yt_artist_tokens = tokenize(yt_artist)
         sp_artist_tokens = tokenize(sp_artist)
 
-        title_score = token_similarity(yt_title_tokens, sp_title_tokens)
-        artist_score = token_similarity(yt_artist_tokens, sp_artist_tokens)
+        title_score = self.scorer.similarity(yt_title_tokens, sp_title_tokens)
+        artist_score = self.scorer.similarity(yt_artist_tokens, sp_artist_tokens)
 
         penalty = uploader_penalty(yt_artist)
 
         final_score = 0.6 * title_score + 0.3 * artist_score - penalty
 
-        logger.debug(
-            "Scores -> title: %.3f, artist: %.3f, penalty: %.2f, final: %.3f",
-            title_score,
-            artist_score,
-            penalty,
-            final_score,
-        )
+        if debug:
+            logger.debug(
+                "Scores -> title: %.3f, artist: %.3f, penalty: %.2f, final: %.3f",
+                title_score,
+                artist_score,
+                penalty,
+                final_score,
+            )
 
-        title_dominant_match = title_score >= 0.60 and artist_in_title_or_uploader(
-            sp_artist, yt_title, yt_artist
+        title_dominant_match = (
+            title_score >= 0.60
+            and artist_tokens_in_title_or_uploader(
+                sp_artist_tokens, yt_title_tokens, yt_artist_tokens
+            )
         )
 
         score_based_match = final_score >= self.FINAL_THRESHOLD and (
@@ -186,26 +527,236 @@ class PatternMatcher:
 
         is_match = title_dominant_match or score_based_match
 
-        logger.debug(
-            "Decision -> title_dominant: %s, score_based: %s, final_match: %s",
-            title_dominant_match,
-            score_based_match,
-            is_match,
+        if debug:
+            logger.debug(
+                "Decision -> title_dominant: %s, score_based: %s, final_match: %s",
+                title_dominant_match,
+                score_based_match,
+                is_match,
+            )
+
+        return final_score, is_match
+
+    def _rank_bonus(
+        self, *, video_info: YTVideoInfo, metadata: Metadata, is_topic: bool
+    ) -> float:
+        """
+        Ranking signals added to the score of a matching result: how close the
+        video length is to the track length, and whether the video comes from an
+        auto-generated `- Topic` channel, which hosts the studio recording.
+        """
+        bonus = 0.0
+
+        if video_info.duration and metadata.duration:
+            offset = abs(video_info.duration - metadata.duration)
+            bonus += self.DURATION_WEIGHT * max(0.0, 1 - offset / self.DURATION_WINDOW)
+
+        if is_topic:
+            bonus += self.TOPIC_BONUS
+
+        return bonus
+
+    def score_batch(
+        self,
+        *,
+        metadata: Metadata,
+        candidates: Sequence[YTVideoInfo],
+        topics: Sequence[bool] | None = None,
+    ) -> BatchScores:
+        """
+        Scores every candidate against a track in one pass.
+
+        Uses the same weights, thresholds, scorer and ranking signals as the `best`
+        mode. Each string is tokenized once and the token sets are encoded as
+        sparse rows over a shared vocabulary, so exact token overlaps are computed
+        with array operations; fuzzy scorers score each candidate in turn.
+
+        Args:
+            metadata (Metadata): The track to match.
+            candidates (Sequence[YTVideoInfo]): The videos to score.
+            topics (Sequence[bool] | None, optional): Whether each uploader is a
+                `- Topic` channel. Checked by the caller, as extraction strips the
+                suffix. Defaults to reading the uploaders as they are.
+
+        Returns:
+            BatchScores: The scores of each candidate, in the order of `candidates`.
+        """
+        import numpy as np
+
+        sp_title_tokens = tokenize(metadata.title or "")
+        sp_artist_tokens = tokenize(metadata.artist or "")
+
+        vocabulary: dict[str, int] = {}
+        title_indptr, title_indices = token_rows(
+            [tokenize(candidate.title or "") for candidate in candidates], vocabulary
         )
+        artist_indptr, artist_indices = token_rows(
+            [tokenize(candidate.uploader or "") for candidate in candidates],
+            vocabulary,
+        )
+
+        for token in sp_title_tokens | sp_artist_tokens:
+            vocabulary.setdefault(token, len(vocabulary))
 
-        return is_match
+        sp_title_mask = np.zeros(len(vocabulary), dtype=bool)
+        sp_title_mask[[vocabulary[token] for token in sp_title_tokens]] = True
+        sp_artist_mask = np.zeros(len(vocabulary), dtype=bool)
+        sp_artist_mask[[vocabulary[token] for token in sp_artist_tokens]] = True
 
-    def find_best_match(
+        if isinstance(self.scorer, TokenSetScorer):
+            title_score = batch_similarity(
+                title_indptr, title_indices, sp_title_tokens, sp_title_mask
+            )
+            artist_score = batch_similarity(
+                artist_indptr, artist_indices, sp_artist_tokens, sp_artist_mask
+            )
+        else:
+            # fuzzy scorers compare tokens pair by pair
+            title_score = np.fromiter(
+                (
+                    self.scorer.similarity(
+                        tokenize(candidate.title or ""), sp_title_tokens
+                    )
+                    for candidate in candidates
+                ),
+                dtype=np.float64,
+                count=len(candidates),
+            )
+            artist_score = np.fromiter(
+                (
+                    self.scorer.similarity(
+                        tokenize(candidate.uploader or ""), sp_artist_tokens
+                    )
+                    for candidate in candidates
+                ),
+                dtype=np.float64,
+                count=len(candidates),
+            )
+        penalty = np.fromiter(
+            (uploader_penalty(candidate.uploader or "") for candidate in candidates),
+            dtype=np.float64,
+            count=len(candidates),
+        )
+
+        final_score = 0.6 * title_score + 0.3 * artist_score - penalty
+
+        artist_in_title_or_uploader = (
+            row_overlap(title_indptr, title_indices, sp_artist_mask) > 0
+        ) | (row_overlap(artist_indptr, artist_indices, sp_artist_mask) > 0)
+
+        title_dominant_match = (title_score >= 0.60) & artist_in_title_or_uploader
+        score_based_match = (final_score >= self.FINAL_THRESHOLD) & (
+            (title_score >= self.TITLE_THRESHOLD)
+            | (artist_score >= self.ARTIST_THRESHOLD)
+        )
+
+        if topics is None:
+            topics = [
+                (candidate.uploader or "").endswith(TOPIC_SUFFIX)
+                for candidate in candidates
+            ]
+
+        bonus = self.TOPIC_BONUS * np.asarray(topics, dtype=np.float64)
+        if metadata.duration:
+            durations = np.fromiter(
+                (candidate.duration or 0 for candidate in candidates),
+                dtype=np.float64,
+                count=len(candidates),
+            )
+            closeness = np.clip(
+                1 - np.abs(durations - metadata.duration) / self.DURATION_WINDOW, 0, 1
+            )
+            bonus += np.where(durations > 0, self.DURATION_WEIGHT * closeness, 0.0)
+
+        rank_score = final_score + bonus
+
+        return BatchScores(
+            title=title_score,
+            artist=artist_score,
+            penalty=penalty,
+            final=final_score,
+            rank=rank_score,
+            matches=title_dominant_match | score_based_match,
+            ranking=np.argsort(-rank_score, kind="stable"),
+        )
+
+    def prefilter(
         self, *, search_results: list[YTVideoInfo], metadata: Metadata
-    ) -> YTVideoInfo:
-        query = f"{metadata.artist} - {metadata.title}"
-        logger.debug("Searching best match for query: '%s'", query)
+    ) -> list[YTVideoInfo]:
+        """
+        Prunes candidates that cannot be the track, before any text extraction.
+
+        Drops videos whose length is far off the track length, such as full album
+        uploads and shorts, and uploads from blocked channels, matched by channel
+        id. Candidates without a duration are kept.
+
+        Args:
+            search_results (list[YTVideoInfo]): The search results.
+            metadata (Metadata): The track to match.
+
+        Returns:
+            list[YTVideoInfo]: The remaining candidates, or all of them if none remain.
+        """
+        max_offset = (
+            max(
+                self.PREFILTER_MIN_DURATION_OFFSET,
+                metadata.duration * self.PREFILTER_DURATION_RATIO,
+            )
+            if metadata.duration
+            else None
+        )
 
-        cache = storage.get(query=query, query_type="youtube")
-        if cache:
-            logger.debug("Cache hit for query: '%s'", query)
-            return cache
+        kept: list[YTVideoInfo] = []
+        for result in search_results:
+            if (
+                max_offset is not None
+                and result.duration
+                and abs(result.duration - metadata.duration) > max_offset
+            ):
+                logger.debug(
+                    "Pruned '%s': %ss long, track is %ss",
+                    result.title,
+                    result.duration,
+                    metadata.duration,
+                )
+                continue
+
+            if result.channel_id in self.blocked_channels:
+                logger.debug(
+                    "Pruned '%s': blocked channel %s", result.title, result.channel_id
+                )
+                continue
+
+            kept.append(result)
+
+        return kept or search_results
+
+    def select_best_match(
+        self, *, search_results: list[YTVideoInfo], metadata: Metadata
+    ) -> YTVideoInfo | None:
+        """
+        Picks the search result matching a track, without touching the cache.
+
+        Args:
+            search_results (list[YTVideoInfo]): The search results. Their artist and
+                title are replaced with the extracted ones.
+            metadata (Metadata): The track to match.
+
+        Returns:
+            YTVideoInfo | None: The matching result, or None if nothing matches.
+        """
+        search_results = self.prefilter(
+            search_results=search_results, metadata=metadata
+        )
+
+        if self.mode == "first":
+            return self._first_match(search_results=search_results, metadata=metadata)
+
+        return self._ranked_match(search_results=search_results, metadata=metadata)
 
+    def _first_match(
+        self, *, search_results: list[YTVideoInfo], metadata: Metadata
+    ) -> YTVideoInfo | None:
         for idx, result in enumerate(search_results):
             logger.debug("#" * 50)
             logger.debug("Evaluating result #%d: %s", idx + 1, result.title)
@@ -217,10 +768,39 @@ class PatternMatcher:
 
             if self.match_tracks(video_info=result, metadata=metadata):
                 logger.debug("Match found: '%s'", result.title)
-                storage.new(query=query, result=result, query_type="youtube")
                 logger.debug("#" * 50)
                 return result
 
-        logger.warning("No match found for query: '%s'", query)
-        storage.new(query=query, result=Sentinel(), query_type="youtube")
-        raise SongNotFound(query)
+        return None
+
+    def _ranked_match(
+        self, *, search_results: list[YTVideoInfo], metadata: Metadata
+    ) -> YTVideoInfo | None:
+        best_match: YTVideoInfo | None = None
+        best_score = float("-inf")
+
+        for idx, result in enumerate(search_results):
+            logger.debug("Ranking result #%d: %s", idx + 1, result.title)
+
+            is_topic = (result.uploader or "").endswith(TOPIC_SUFFIX)
+            result.full_title = self.extractor.extract_artist_and_title(
+                video_info=result, metadata=metadata
+            )
+
+            score, is_match = self._evaluate(video_info=result, metadata=metadata)
+            if not is_match:
+                continue
+
+            score += self._rank_bonus(
+                video_info=result, metadata=metadata, is_topic=is_topic
+            )
+            logger.debug("Rank score: %.3f", score)
+
+            if score > best_score:
+                best_match, best_score = result, score
+
+            if score >= self.NEAR_PERFECT_SCORE:
+                logger.debug("Near perfect match, skipping remaining results")
+                break
+
+        return best_match
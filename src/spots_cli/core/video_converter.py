@@ -1,13 +1,18 @@
+from __future__ import annotations
+
 from logging import getLogger
-from moviepy.audio.io.AudioFileClip import AudioFileClip
 from mutagen.id3 import ID3
 from mutagen.id3._frames import APIC, TIT2, TPE1, TRCK, TALB, USLT, TDRL
 from mutagen.mp3 import MP3
 from os import remove
 from requests import get
+from typing import TYPE_CHECKING
 
 from spots_cli.models.metadata import Metadata
 
+if TYPE_CHECKING:
+    from spots_cli.core import LyricsFinder
+
 logger = getLogger(__name__)
 
 
@@ -17,7 +22,7 @@ class VideoConverter:
     and updating their metadata.
 
     Attributes:
-        @add_to_history (AddToHistoryService): Service for adding downloaded songs to history.
+        @lyrics (LyricsFinder): Service for resolving lyrics that were not fetched yet.
 
     Methods:
         @update_metadata
@@ -31,6 +36,9 @@ class VideoConverter:
     - Adding successful downloads to the download history
     """
 
+    def __init__(self, *, lyrics: LyricsFinder):
+        self.lyrics = lyrics
+
     def update_metadata(self, *, audio_path: str, metadata: Metadata) -> bool:
         """
         Update the ID3 metadata of an MP3 file.
@@ -75,14 +83,15 @@ class VideoConverter:
                     )
                 )
 
-            # Add lyrics if provided
-            if metadata.lyrics:
+            # Add lyrics if found
+            lyrics = self.lyrics.resolve(metadata)
+            if lyrics:
                 audio.tags.add(
                     USLT(
                         encoding=3,
                         lang="eng",
                         desc="",
-                        text=metadata.lyrics,
+                        text=lyrics,
                     )
                 )
 
@@ -128,6 +137,9 @@ class VideoConverter:
         Returns:
             bool: True indicates a successful download
         """
+        # moviepy pulls in numpy and imageio, only load it to convert
+        from moviepy.audio.io.AudioFileClip import AudioFileClip
+
         try:
             # Load the audio clip
             clip = AudioFileClip(old_file)
@@ -1,8 +1,13 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
-from bs4 import BeautifulSoup, Comment, Tag
 from logging import getLogger
 from re import search
 from requests import get
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
 
 logger = getLogger(__name__)
 
@@ -16,6 +21,8 @@ class ScrapedResult:
 
 def get_element_by_comment(soup: BeautifulSoup, comment_text: str):
     """Find the first element that follows a comment with exact `comment_text`."""
+    from bs4 import Comment
+
     comments = soup.find_all(string=lambda text: isinstance(text, Comment))
 
     for comment in comments:
@@ -29,6 +36,7 @@ def get_element_by_comment(soup: BeautifulSoup, comment_text: str):
 
 class WebScraper:
     def scrape_azlyrics(self, *, artist: str, title: str):
+        from bs4 import BeautifulSoup
 
         logger.debug("Searching for lyrics on AZLyrics")
         artist = artist.lower().replace(" ", "")
@@ -46,6 +54,8 @@ class WebScraper:
         if not (search("spotify", url) and search("playlist", url)):
             raise TypeError("Please provide a valid Spotify playlist url")
 
+        from bs4 import BeautifulSoup, Tag
+
         logger.debug("Scraping spotify playlist")
 
         response = get(url)
@@ -1,73 +1,210 @@
+from dataclasses import dataclass
+from functools import lru_cache
 from html import unescape
+from typing import Sequence
 from unicodedata import normalize
-from re import compile, escape, IGNORECASE, search, sub, split
+from re import Pattern, compile, escape, IGNORECASE
 
 from spots_cli.models.yt_video_info import YTVideoInfo
 from spots_cli.models.metadata import Metadata
 from spots_cli.models.helper_models import ArtistAndTitle
 
+ODD_KEYWORDS = (
+    " (Live Session) | Vevo Ctrl",
+    " [Official Audio]",
+    " (Audio Visual)",
+    " | Official Audio",
+    " | Official",
+    " (Official Audio)",
+    " (Official Video)",
+    " (Audio)",
+    " Uncut [HD]",
+    " [Video]",
+    " (HD)",
+    " (Official Music Video)",
+    " [Official Music Video]",
+    " - Topic",
+    " (Official Visualizer)",
+    " (Complete)",
+    " (Visualizer)",
+    " [Official Lyrics Video]",
+    " (Lyric Video)",
+    " (Lyrics)",
+    " (Official HD Video)",
+    " (Audio Oficial)",
+    " Official Music Video",
+    " [Official Video]",
+    " - Official Video",
+    " (Original Video)",
+    "(LYRICS+PICTURES)",
+    " [Lyrics]",
+    " HQ",
+    " - Audio",
+    " (Album Version)",
+    " (Clean Version)",
+)
+
+# past this many keywords a single trie scan beats a regex alternation
+TRIE_KEYWORDS_THRESHOLD = 256
+PATTERN_CACHE_SIZE = 1024
+VIEW_CACHE_SIZE = 8192
+
+TITLE_SEPARATOR_PATTERN = compile(r"\s*[-|:•]\s*|\s{2,}")
+NON_WORD_PATTERN = compile(r"\W")
+
+
+class KeywordTrie:
+    """
+    Case-insensitive keyword stripper for large keyword sets.
+
+    Scans the text once, removing the longest keyword starting at each
+    position, so the cost does not grow with the number of keywords.
+    """
+
+    END = ""
+
+    def __init__(self, keywords: tuple[str, ...]):
+        self.root: dict = {}
+        for keyword in keywords:
+            if not keyword:
+                continue
+            node = self.root
+            for char in keyword.lower():
+                node = node.setdefault(char, {})
+            node[self.END] = True
+
+    def match_length(self, text: str, start: int) -> int:
+        """The length of the longest keyword at `start`, 0 if none."""
+        node, longest = self.root, 0
+        for index in range(start, len(text)):
+            node = node.get(text[index].lower())
+            if node is None:
+                break
+            if self.END in node:
+                longest = index - start + 1
+        return longest
+
+    def sub(self, repl: str, text: str) -> str:
+        """Replaces every keyword in `text` with `repl`, like `Pattern.sub`."""
+        kept: list[str] = []
+        index = 0
+        while index < len(text):
+            length = self.match_length(text, index)
+            if length:
+                kept.append(repl)
+                index += length
+            else:
+                kept.append(text[index])
+                index += 1
+        return "".join(kept)
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def keyword_stripper(
+    extra_keywords: tuple[str, ...] = (),
+) -> Pattern[str] | KeywordTrie:
+    """The compiled stripper for the default keywords plus `extra_keywords`."""
+    keywords = ODD_KEYWORDS + extra_keywords
+    if len(keywords) > TRIE_KEYWORDS_THRESHOLD:
+        return KeywordTrie(keywords)
+
+    return compile("|".join(escape(k) for k in keywords), flags=IGNORECASE)
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def artist_prefix_pattern(artist: str) -> Pattern[str]:
+    return compile(rf"{escape(artist)}\W?", flags=IGNORECASE)
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def artist_before_title_pattern(artist: str) -> Pattern[str]:
+    return compile(rf"{escape(artist)}\W")
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def artist_after_title_pattern(artist: str) -> Pattern[str]:
+    return compile(rf"\W{escape(artist)}", flags=IGNORECASE)
+
+
+def strip_first_non_word(text: str) -> str:
+    return NON_WORD_PATTERN.sub("", text, count=1)
+
+
+def strip_last_non_word(text: str) -> str:
+    return strip_first_non_word(text[::-1])[::-1]
+
+
+@lru_cache(maxsize=VIEW_CACHE_SIZE)
+def normalize_special_chars(text: str) -> str:
+    return (
+        normalize("NFKD", text)
+        .encode("ascii", "ignore")
+        .decode("ascii")
+        .lower()
+        .replace("–", "-")
+        .strip()
+    )
+
+
+@dataclass(frozen=True)
+class VideoView:
+    """
+    The decoded and normalized strings of a search result.
+
+    Args:
+        title (str): The HTML-unescaped title.
+        normalized_title (str): The normalized title.
+        normalized_uploader (str): The normalized uploader.
+        artist_candidates (tuple[str, ...]): Where the artist may be: the uploader,
+            then the title parts around the first separator.
+    """
+
+    title: str
+    normalized_title: str
+    normalized_uploader: str
+    artist_candidates: tuple[str, ...]
+
+
+@lru_cache(maxsize=VIEW_CACHE_SIZE)
+def video_view(title: str, uploader: str) -> VideoView:
+    """The normalized view of a search result, computed once per title and uploader."""
+    try:
+        decoded_title = unescape(title)
+    except TypeError:
+        decoded_title = title
+
+    normalized_title = normalize_special_chars(decoded_title)
+    normalized_uploader = normalize_special_chars(uploader)
+
+    return VideoView(
+        title=decoded_title,
+        normalized_title=normalized_title,
+        normalized_uploader=normalized_uploader,
+        artist_candidates=(
+            normalized_uploader,
+            *TITLE_SEPARATOR_PATTERN.split(normalized_title, maxsplit=1),
+        ),
+    )
+
 
 class YouTubeExtractor:
     """A service for extracting data from a YouTubeVideoInfo"""
 
     @staticmethod
-    def remove_odd_keywords(title: str, keywords_list: list[str] = []) -> str:
-        defined_keywords = [
-            " (Live Session) | Vevo Ctrl",
-            " [Official Audio]",
-            " (Audio Visual)",
-            " | Official Audio",
-            " | Official",
-            " (Official Audio)",
-            " (Official Video)",
-            " (Audio)",
-            " Uncut [HD]",
-            " [Video]",
-            " (HD)",
-            " (Official Music Video)",
-            " [Official Music Video]",
-            " - Topic",
-            " (Official Visualizer)",
-            " (Complete)",
-            " (Visualizer)",
-            " [Official Lyrics Video]",
-            " (Lyric Video)",
-            " (Lyrics)",
-            " (Official HD Video)",
-            " (Audio Oficial)",
-            " Official Music Video",
-            " [Official Video]",
-            " - Official Video",
-            " (Original Video)",
-            "(LYRICS+PICTURES)",
-            " [Lyrics]",
-            " HQ",
-            " - Audio",
-            " (Album Version)",
-            " (Clean Version)",
-        ]
-
+    def remove_odd_keywords(title: str, keywords_list: list[str] | None = None) -> str:
         title = title.replace("(with", "(feat.")
 
-        odd_keywords = (
-            defined_keywords + keywords_list
-            if all(isinstance(k, str) for k in keywords_list)
-            else defined_keywords
+        extra_keywords = (
+            tuple(keywords_list)
+            if keywords_list and all(isinstance(k, str) for k in keywords_list)
+            else ()
         )
 
-        pattern = compile("|".join(escape(k) for k in odd_keywords), flags=IGNORECASE)
-        return pattern.sub("", title).strip()
+        return keyword_stripper(extra_keywords).sub("", title).strip()
 
     @staticmethod
     def normalize_special_chars(text: str) -> str:
-        return (
-            normalize("NFKD", text)
-            .encode("ascii", "ignore")
-            .decode("ascii")
-            .lower()
-            .replace("–", "-")
-            .strip()
-        )
+        return normalize_special_chars(text)
 
     def extract_artist_and_title(
         self, *, video_info: YTVideoInfo, metadata: Metadata
@@ -80,78 +217,92 @@ class YouTubeExtractor:
         Returns:
             ArtistAndTitle: The extracted title and artist.
         """
-        # Decode the string
-        try:
-            video_title = unescape(video_info.title)
-        except TypeError:
-            video_title = video_info.title
+        return self._extract(
+            view=video_view(video_info.title, video_info.uploader),
+            uploader=video_info.uploader,
+            sp_artist=metadata.artist,
+        )
 
-        # normalize tokens
-        normalized_yt_artist = self.normalize_special_chars(video_info.uploader)
-        normalized_yt_title = self.normalize_special_chars(video_title)
-        normalized_sp_artist = self.normalize_special_chars(metadata.artist)
+    def extract_many(
+        self, *, candidates: Sequence[YTVideoInfo], metadata: Metadata
+    ) -> list[ArtistAndTitle]:
+        """Extracts the title and artist from several search results for one track.
 
-        title_parts = split(r"\s*[-|:•]\s*|\s{2,}", normalized_yt_title, maxsplit=1)
+        Args:
+            candidates (Sequence[YTVideoInfo]): The search results to be processed.
+            metadata (Metadata): The track searched for.
 
-        ARTIST_CANDIDATES = [normalized_yt_artist.strip()] + title_parts
+        Returns:
+            list[ArtistAndTitle]: The extracted title and artist, in the order of `candidates`.
+        """
+        return [
+            self._extract(
+                view=video_view(candidate.title, candidate.uploader),
+                uploader=candidate.uploader,
+                sp_artist=metadata.artist,
+            )
+            for candidate in candidates
+        ]
 
-        def recursive_artist_search(pattern: str, index: int):
-            if search(escape(pattern), normalized_sp_artist, flags=IGNORECASE):
-                return pattern, index
-            if index == (len(ARTIST_CANDIDATES) - 1):
-                return video_info.uploader, 0
-            next_index = index + 1
-            return recursive_artist_search(ARTIST_CANDIDATES[next_index], next_index)
+    @staticmethod
+    def artist_index(view: VideoView, normalized_sp_artist: str) -> int:
+        """The index of the first artist candidate found in the track artist, else 0."""
+        for index, candidate in enumerate(view.artist_candidates):
+            if candidate in normalized_sp_artist:
+                return index
+        return 0
 
-        _, uploader_index = recursive_artist_search(ARTIST_CANDIDATES[0], 0)
+    def _extract(
+        self, *, view: VideoView, uploader: str, sp_artist: str
+    ) -> ArtistAndTitle:
+        video_title = view.title
+        normalized_sp_artist = normalize_special_chars(sp_artist)
 
-        match uploader_index:
+        match self.artist_index(view, normalized_sp_artist):
             case 0:
                 # artist is uploader
-                youtube_artist, youtube_title = video_info.uploader, video_title
+                youtube_artist, youtube_title = uploader, video_title
 
                 # check for artist repeat in title
-                if normalized_yt_artist in normalized_yt_title:
-                    artist_pattern = compile(rf"{youtube_artist}\W?", flags=IGNORECASE)
-                    youtube_title = sub(artist_pattern, "", video_title)
+                if view.normalized_uploader in view.normalized_title:
+                    youtube_title = artist_prefix_pattern(youtube_artist).sub(
+                        "", video_title
+                    )
 
                     # strip title
-                    youtube_title = sub(r"\W", "", youtube_title, count=1)
-                    youtube_title = youtube_title
+                    youtube_title = strip_first_non_word(youtube_title)
             case 1:
                 # different uploader, artist in title
-                pattern = rf"{escape(metadata.artist)}\W"
-                pattern_match = search(pattern, video_title)
+                pattern_match = artist_before_title_pattern(sp_artist).search(
+                    video_title
+                )
 
                 if pattern_match:
                     # strip artist
-                    youtube_artist = pattern_match.group(0)
-                    rev_artist = youtube_artist[::-1]
-                    youtube_artist = sub(r"\W", "", rev_artist, count=1)
-                    youtube_artist = youtube_artist[::-1]
+                    youtube_artist = strip_last_non_word(pattern_match.group(0))
 
                     # strip title
-                    youtube_title = video_title[pattern_match.end() :]
-                    youtube_title = sub(r"\W", "", youtube_title, count=1)
+                    youtube_title = strip_first_non_word(
+                        video_title[pattern_match.end() :]
+                    )
                 else:
-                    youtube_artist, youtube_title = video_info.uploader, video_title
+                    youtube_artist, youtube_title = uploader, video_title
             case _:
                 # different uploader, artist and title reversed
-                pattern = rf"\W{escape(self.normalize_special_chars(metadata.artist))}"
-                pattern_match = search(pattern, video_title, flags=IGNORECASE)
+                pattern_match = artist_after_title_pattern(normalized_sp_artist).search(
+                    video_title
+                )
 
                 if pattern_match:
                     # strip artist
-                    youtube_artist = pattern_match.group(0)
-                    youtube_artist = sub(r"\W", "", youtube_artist, count=1)
+                    youtube_artist = strip_first_non_word(pattern_match.group(0))
 
                     # strip title
-                    youtube_title = video_title[: pattern_match.start()]
-                    rev_title = youtube_title[::-1]
-                    youtube_title = sub(r"\W", "", rev_title, count=1)
-                    youtube_title = youtube_title[::-1]
+                    youtube_title = strip_last_non_word(
+                        video_title[: pattern_match.start()]
+                    )
                 else:
-                    youtube_artist, youtube_title = video_info.uploader, video_title
+                    youtube_artist, youtube_title = uploader, video_title
 
         youtube_title = youtube_title.rstrip(" |–-")
         youtube_title = self.remove_odd_keywords(youtube_title)
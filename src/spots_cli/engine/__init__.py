@@ -1,3 +1,10 @@
 from spots_cli.engine.file_storage import FileStorage
+from spots_cli.engine.library_index import LibraryEntry, LibraryIndex, song_key
+from spots_cli.engine.migration_queue import (
+    MigrationItem,
+    MigrationQueue,
+    MigrationState,
+)
 from spots_cli.engine.persistence_model import storage
+from spots_cli.engine.quota_budget import QuotaBudget
 from spots_cli.engine.retry import retry
@@ -1,3 +1,4 @@
+from dataclasses import asdict
 from json import load, dump
 from json.decoder import JSONDecodeError
 from logging import getLogger
@@ -5,20 +6,40 @@ from os.path import exists
 from pathlib import Path
 from shutil import move
 from tempfile import NamedTemporaryFile
-from typing import Any, Literal, Optional, TypedDict, Sequence, overload
-
-from spots_cli.models import SongNotFound, Metadata, Sentinel, YTVideoInfo
+from typing import Any, Literal, Optional, TypedDict, overload
+
+from spots_cli.models import (
+    SongNotFound,
+    Metadata,
+    Sentinel,
+    YTVideoInfo,
+    PlaylistInfo,
+    LyricsRecord,
+    SearchRecord,
+)
 from spots_cli.utils import get_config_path
 
 logger = getLogger(__name__)
 
 
 TMetadataCache = dict[str, Metadata | Sentinel]
-TArtistCache = dict[str, Sequence[YTVideoInfo | Sentinel]]
+TArtistCache = dict[str, list[YTVideoInfo | Sentinel]]
+TAlbumCache = dict[str, PlaylistInfo | Sentinel]
+TLyricsCache = dict[str, LyricsRecord]
+TSearchCache = dict[str, SearchRecord]
 
 TSerializedRecord = dict[str, dict[str, Any]]
 
-MediaProviders = Literal["artist", "youtube", "yt_likes", "spotify_likes", "metadata"]
+MediaProviders = Literal[
+    "artist",
+    "youtube",
+    "yt_likes",
+    "spotify_likes",
+    "metadata",
+    "album",
+    "lyrics",
+    "search",
+]
 
 NOT_FOUND = Sentinel()
 
@@ -29,6 +50,9 @@ class CacheOptions(TypedDict):
     youtube: dict[str, Any]
     yt_likes: dict[str, YTVideoInfo | Sentinel]
     spotify_likes: TMetadataCache
+    album: TAlbumCache
+    lyrics: TLyricsCache
+    search: TSearchCache
 
 
 class SerializedCacheOptions(TypedDict):
@@ -37,6 +61,20 @@ class SerializedCacheOptions(TypedDict):
     youtube: dict[str, YTVideoInfo]
     yt_likes: dict[str, TSerializedRecord]
     spotify_likes: dict[str, TSerializedRecord]
+    album: dict[str, dict[str, Any]]
+    lyrics: dict[str, dict[str, Any]]
+    search: dict[str, dict[str, Any]]
+
+
+def deserialize_playlist(record: dict[str, Any]) -> PlaylistInfo:
+    return PlaylistInfo(
+        name=record["name"],
+        cover=record["cover"],
+        artist=record.get("artist"),
+        provider_metadata=[Metadata(**item) for item in record["provider_metadata"]],
+        youtube_metadata=[YTVideoInfo(**item) for item in record["youtube_metadata"]],
+        snapshot_id=record.get("snapshot_id"),
+    )
 
 
 class FileStorage:
@@ -50,8 +88,20 @@ class FileStorage:
             "youtube": {},
             "yt_likes": {},
             "spotify_likes": {},
+            "album": {},
+            "lyrics": {},
+            "search": {},
         }
         self._dirty = False
+        self._loaded = False
+
+    def load(self) -> None:
+        """Creates and reads the cache file, once per process."""
+        if self._loaded:
+            return
+
+        self.cache_file_exists()
+        self.reload()
 
     def update_youtube(
         self,
@@ -80,6 +130,9 @@ class FileStorage:
                 "youtube": {},
                 "yt_likes": {},
                 "spotify_likes": {},
+                "album": {},
+                "lyrics": {},
+                "search": {},
             }
 
             with open(self.__file_path, "w") as f:
@@ -124,7 +177,7 @@ class FileStorage:
         self,
         *,
         query: str,
-        result: Sequence[YTVideoInfo | Sentinel],
+        result: YTVideoInfo | Sentinel,
         query_type: Literal["artist"],
     ) -> None: ...
 
@@ -137,6 +190,33 @@ class FileStorage:
         query_type: Literal["youtube"],
     ) -> None: ...
 
+    @overload
+    def new(
+        self,
+        *,
+        query: str,
+        result: PlaylistInfo | Sentinel,
+        query_type: Literal["album"],
+    ) -> None: ...
+
+    @overload
+    def new(
+        self,
+        *,
+        query: str,
+        result: LyricsRecord,
+        query_type: Literal["lyrics"],
+    ) -> None: ...
+
+    @overload
+    def new(
+        self,
+        *,
+        query: str,
+        result: SearchRecord,
+        query_type: Literal["search"],
+    ) -> None: ...
+
     def new(
         self,
         *,
@@ -146,7 +226,11 @@ class FileStorage:
     ) -> None:
         query = query.replace(" Audio", "")
 
-        if self.__objects[query_type].get(query):
+        # lyrics and search records expire, so a newer lookup replaces the old
+        # one, artist entries collect videos one at a time
+        if query_type not in ("lyrics", "search", "artist") and self.__objects[
+            query_type
+        ].get(query):
             return
 
         logger.debug(f"[Cache] New entry: {query}")
@@ -156,17 +240,19 @@ class FileStorage:
             case "metadata":
                 self.__objects["metadata"][query] = result
             case "artist":
-                if not self.__objects["artist"][query]:
-                    self.__objects["artist"][query] = []
-                self.__objects["artist"][query] = list(
-                    self.__objects["artist"][query]
-                ) + [result]
+                self.__objects["artist"].setdefault(query, []).append(result)
             case "youtube":
                 self.__objects["youtube"][query] = result
             case "spotify_likes":
                 self.__objects["spotify_likes"][query] = result
             case "yt_likes":
                 self.__objects["yt_likes"][query] = result
+            case "album":
+                self.__objects["album"][query] = result
+            case "lyrics":
+                self.__objects["lyrics"][query] = result
+            case "search":
+                self.__objects["search"][query] = result
 
     def save(self) -> None:
         """Serializes and saves the cache to the JSON file safely."""
@@ -183,8 +269,10 @@ class FileStorage:
                 artist: [item.__dict__ for item in playlist]
                 for artist, playlist in self.__objects["artist"].items()
             },
+            # copied first, pipelined searches may still be adding entries
             "youtube": {
-                key: value.__dict__ for key, value in self.__objects["youtube"].items()
+                key: value.__dict__
+                for key, value in self.__objects["youtube"].copy().items()
             },
             "yt_likes": {
                 key: value.__dict__ for key, value in self.__objects["yt_likes"].items()
@@ -193,6 +281,19 @@ class FileStorage:
                 key: value.__dict__
                 for key, value in self.__objects["spotify_likes"].items()
             },
+            "album": {
+                key: asdict(value) if isinstance(value, PlaylistInfo) else {}
+                for key, value in self.__objects["album"].items()
+            },
+            # copied first, background lyrics lookups may still be adding entries
+            "lyrics": {
+                key: value.__dict__
+                for key, value in self.__objects["lyrics"].copy().items()
+            },
+            "search": {
+                key: asdict(value)
+                for key, value in self.__objects["search"].copy().items()
+            },
         }
 
         # Write to temp file in the same directory
@@ -279,6 +380,39 @@ class FileStorage:
                     }
                 else:
                     self.__objects["yt_likes"] = {}
+
+                if "album" in loaded_objects:
+                    self.__objects["album"] = {
+                        key: (
+                            deserialize_playlist(value)
+                            if value != NOT_FOUND.__dict__
+                            else NOT_FOUND
+                        )
+                        for key, value in loaded_objects["album"].items()
+                    }
+                else:
+                    self.__objects["album"] = {}
+
+                if "lyrics" in loaded_objects:
+                    self.__objects["lyrics"] = {
+                        key: LyricsRecord(**value)
+                        for key, value in loaded_objects["lyrics"].items()
+                    }
+                else:
+                    self.__objects["lyrics"] = {}
+
+                if "search" in loaded_objects:
+                    # entries without a fetch time predate expiry, searched again
+                    self.__objects["search"] = {
+                        key: SearchRecord(
+                            fetched_at=value["fetched_at"],
+                            results=[YTVideoInfo(**item) for item in value["results"]],
+                        )
+                        for key, value in loaded_objects["search"].items()
+                        if isinstance(value, dict) and "fetched_at" in value
+                    }
+                else:
+                    self.__objects["search"] = {}
         except (FileNotFoundError, JSONDecodeError):
             self.__objects = {
                 "metadata": {},
@@ -286,8 +420,13 @@ class FileStorage:
                 "youtube": {},
                 "yt_likes": {},
                 "spotify_likes": {},
+                "album": {},
+                "lyrics": {},
+                "search": {},
             }
 
+        self._loaded = True
+
     @overload
     def get(
         self,
@@ -304,7 +443,7 @@ class FileStorage:
         query: str,
         query_type: Literal["artist"],
         alt_query: str = "",
-    ) -> list[Metadata]: ...
+    ) -> list[YTVideoInfo | Sentinel] | None: ...
 
     @overload
     def get(
@@ -324,6 +463,33 @@ class FileStorage:
         alt_query: str = "",
     ) -> YTVideoInfo: ...
 
+    @overload
+    def get(
+        self,
+        *,
+        query: str,
+        query_type: Literal["album"],
+        alt_query: str = "",
+    ) -> PlaylistInfo: ...
+
+    @overload
+    def get(
+        self,
+        *,
+        query: str,
+        query_type: Literal["lyrics"],
+        alt_query: str = "",
+    ) -> LyricsRecord | None: ...
+
+    @overload
+    def get(
+        self,
+        *,
+        query: str,
+        query_type: Literal["search"],
+        alt_query: str = "",
+    ) -> SearchRecord | None: ...
+
     def get(
         self,
         *,
@@ -0,0 +1,290 @@
+from dataclasses import dataclass
+from json import dumps, loads
+from logging import getLogger
+from os import sep
+from sqlite3 import connect
+from threading import Lock
+from typing import Callable, Iterable, Optional
+from unicodedata import category, normalize
+
+from spots_cli.models import PlaylistSnapshot
+from spots_cli.utils import get_config_path
+
+logger = getLogger(__name__)
+
+# the combining accents of the Latin, Greek and Cyrillic scripts
+ACCENTS = range(0x0300, 0x0370)
+
+
+def is_word_char(char: str) -> bool:
+    """Letters, digits and the marks other scripts spell words with."""
+    return char.isalnum() or category(char).startswith("M")
+
+
+def song_key(artist: str, title: str) -> str:
+    """
+    A normalized `artist - title`, ignoring case, accents and punctuation, so
+    tags, provider metadata and history entries of a song share a key.
+
+    Only accents are folded, the marks of other scripts, such as kana voicing
+    marks and Indic vowel signs, tell songs apart.
+
+    >>> song_key("Beyoncé", "Halo") == song_key("Beyonce", "Halo")
+    True
+    >>> song_key("", "ばか ばら") == song_key("", "はか はら")
+    False
+    >>> song_key("", "नमस्ते") == song_key("", "नमसते")
+    False
+    """
+    name = f"{artist} - {title}" if artist else title
+    decomposed = normalize("NFKD", name.casefold())
+    folded = normalize(
+        "NFC", "".join(char for char in decomposed if ord(char) not in ACCENTS)
+    )
+    words = "".join(char if is_word_char(char) else " " for char in folded)
+    return " ".join(words.split())
+
+
+@dataclass(frozen=True)
+class LibraryEntry:
+    """A song the user owns, and the keys it is known by."""
+
+    artist: str
+    title: str
+    provider_id: Optional[str] = None
+    video_id: Optional[str] = None
+    filename: Optional[str] = None
+    path: Optional[str] = None
+
+
+class LibraryIndex:
+    """
+    A SQLite index of the songs the user owns.
+
+    Songs are looked up by provider track link, YouTube video id, normalized
+    artist and title, or download filename, each through an index, so checking
+    whether a song is owned costs no more than a single query. The tracks of
+    synced playlists are kept as well, to diff them on the next sync.
+
+    Methods:
+        @add
+        @add_many
+        @contains
+        @remove_paths
+        @paths_under
+        @import_history
+        @playlist_snapshot
+        @save_playlist_snapshot
+        @orphaned_paths
+    """
+
+    # `PRAGMA user_version` once the downloads history is imported
+    HISTORY_IMPORTED = 1
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS songs (
+            id INTEGER PRIMARY KEY,
+            song_key TEXT NOT NULL,
+            provider_id TEXT,
+            video_id TEXT,
+            filename TEXT,
+            path TEXT UNIQUE
+        );
+        CREATE INDEX IF NOT EXISTS songs_song_key ON songs (song_key);
+        CREATE INDEX IF NOT EXISTS songs_provider_id ON songs (provider_id);
+        CREATE INDEX IF NOT EXISTS songs_video_id ON songs (video_id);
+        CREATE INDEX IF NOT EXISTS songs_filename ON songs (filename);
+        CREATE TABLE IF NOT EXISTS playlists (
+            url TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            snapshot_id TEXT,
+            track_ids TEXT NOT NULL
+        );
+    """
+
+    def __init__(self, *, path: Optional[str] = None):
+        self.__path = path or str(get_config_path() / "library.db")
+        # shared by the API request threads, writes are serialized by the lock
+        self.__connection = connect(self.__path, check_same_thread=False)
+        self.__lock = Lock()
+
+        with self.__lock, self.__connection:
+            self.__connection.executescript(self.SCHEMA)
+
+    @staticmethod
+    def _row(entry: LibraryEntry) -> tuple:
+        return (
+            song_key(entry.artist, entry.title),
+            entry.provider_id or None,
+            entry.video_id or None,
+            entry.filename or None,
+            entry.path or None,
+        )
+
+    def add(self, entry: LibraryEntry) -> None:
+        self.add_many([entry])
+
+    def add_many(self, entries: Iterable[LibraryEntry]) -> None:
+        """Adds the entries in one transaction, replacing those at the same path."""
+        rows = [self._row(entry) for entry in entries if entry.title]
+
+        with self.__lock, self.__connection:
+            self.__connection.executemany(
+                """
+                INSERT INTO songs (song_key, provider_id, video_id, filename, path)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (path) DO UPDATE SET
+                    song_key = excluded.song_key,
+                    provider_id = coalesce(excluded.provider_id, provider_id),
+                    video_id = coalesce(excluded.video_id, video_id),
+                    filename = coalesce(excluded.filename, filename)
+                """,
+                rows,
+            )
+
+    def contains(
+        self,
+        *,
+        provider_id: Optional[str] = None,
+        video_id: Optional[str] = None,
+        artist: Optional[str] = None,
+        title: Optional[str] = None,
+        filename: Optional[str] = None,
+    ) -> bool:
+        """Checks if a song is owned, matching any of the keys given."""
+        clauses: list[str] = []
+        params: list[str] = []
+
+        for column, value in (
+            ("provider_id", provider_id),
+            ("video_id", video_id),
+            ("song_key", song_key(artist or "", title) if title else None),
+            ("filename", filename),
+        ):
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+
+        if not clauses:
+            return False
+
+        # one indexed lookup per key
+        query = " UNION ALL ".join(
+            f"SELECT 1 FROM songs WHERE {clause}" for clause in clauses
+        )
+        with self.__lock:
+            row = self.__connection.execute(f"{query} LIMIT 1", params).fetchone()
+
+        return row is not None
+
+    def remove_paths(self, paths: Iterable[str]) -> None:
+        """Forgets the songs stored at `paths`."""
+        with self.__lock, self.__connection:
+            self.__connection.executemany(
+                "DELETE FROM songs WHERE path = ?", ((path,) for path in paths)
+            )
+
+    def paths_under(self, folder: str) -> list[str]:
+        """The paths of the indexed songs stored under `folder`."""
+        prefix = folder.rstrip(sep) + sep
+        with self.__lock:
+            rows = self.__connection.execute(
+                "SELECT path FROM songs WHERE substr(path, 1, ?) = ?",
+                (len(prefix), prefix),
+            ).fetchall()
+
+        return [path for (path,) in rows]
+
+    def import_history(self, titles: Callable[[], Iterable[str]]) -> None:
+        """
+        Adds the songs of the downloads history, once per index.
+
+        The import is recorded in the database, so songs indexed before it by the
+        scripts don't skip it. The write lock is taken before checking, so
+        concurrent imports, from another connection as well, run once.
+
+        Args:
+            titles (Callable[[], Iterable[str]]): Reads the titles of the history.
+        """
+        with self.__lock, self.__connection:
+            self.__connection.execute("BEGIN IMMEDIATE")
+            (version,) = self.__connection.execute("PRAGMA user_version").fetchone()
+            if version >= self.HISTORY_IMPORTED:
+                return
+
+            # songs downloaded before the index existed
+            self.__connection.executemany(
+                """
+                INSERT INTO songs (song_key, provider_id, video_id, filename, path)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (
+                    self._row(LibraryEntry(artist="", title=title, filename=title))
+                    for title in titles()
+                    if title
+                ),
+            )
+            self.__connection.execute(f"PRAGMA user_version = {self.HISTORY_IMPORTED}")
+
+    def playlist_snapshot(self, url: str) -> Optional[PlaylistSnapshot]:
+        """The tracks of a playlist when it was last synced, None if it never was."""
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT name, snapshot_id, track_ids FROM playlists WHERE url = ?",
+                (url,),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        name, snapshot_id, track_ids = row
+        return PlaylistSnapshot(
+            url=url, name=name, snapshot_id=snapshot_id, track_ids=loads(track_ids)
+        )
+
+    def save_playlist_snapshot(self, snapshot: PlaylistSnapshot) -> None:
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                """
+                INSERT INTO playlists (url, name, snapshot_id, track_ids)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (url) DO UPDATE SET
+                    name = excluded.name,
+                    snapshot_id = excluded.snapshot_id,
+                    track_ids = excluded.track_ids
+                """,
+                (
+                    snapshot.url,
+                    snapshot.name,
+                    snapshot.snapshot_id,
+                    dumps(snapshot.track_ids),
+                ),
+            )
+
+    def orphaned_paths(
+        self, track_ids: Iterable[str], *, playlist_url: str
+    ) -> list[str]:
+        """
+        The files of the tracks removed from a playlist, leaving out tracks that
+        are still in another synced playlist.
+        """
+        with self.__lock:
+            rows = self.__connection.execute(
+                "SELECT track_ids FROM playlists WHERE url != ?", (playlist_url,)
+            ).fetchall()
+            kept = {track_id for (ids,) in rows for track_id in loads(ids)}
+
+            removed = [track_id for track_id in track_ids if track_id not in kept]
+            paths = [
+                path
+                for track_id in removed
+                for (path,) in self.__connection.execute(
+                    """
+                    SELECT path FROM songs
+                    WHERE (provider_id = ? OR video_id = ?) AND path IS NOT NULL
+                    """,
+                    (track_id, track_id),
+                )
+            ]
+
+        return paths
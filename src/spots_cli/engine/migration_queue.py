@@ -0,0 +1,175 @@
+from collections import Counter
+from dataclasses import asdict, dataclass
+from json import JSONDecodeError, dump, load
+from logging import getLogger
+from os import replace
+from typing import Iterable, Iterator, Literal, Optional
+
+from spots_cli.models import YTVideoInfo
+from spots_cli.utils import get_config_path
+
+logger = getLogger(__name__)
+
+MigrationState = Literal["pending", "searched", "matched", "liked", "failed"]
+
+
+@dataclass
+class MigrationItem:
+    """
+    A track of a migration and how far it got.
+
+    States:
+        pending: not looked at yet.
+        searched: searched, nothing to migrate (no match, or the video can't be rated).
+        matched: the video is found, not migrated yet.
+        liked: migrated.
+        failed: stopped by an unexpected error, kept for a retry pass.
+    """
+
+    key: str
+    state: MigrationState = "pending"
+    video: Optional[YTVideoInfo] = None
+    error: Optional[str] = None
+
+
+class MigrationQueue:
+    """
+    A persisted, ordered work queue of the tracks of a migration.
+
+    Items are appended in the order they should be migrated. The position of
+    the first incomplete item is persisted with them, so a restarted migration
+    resumes from it without looking at the items before.
+
+    Methods:
+        @extend
+        @mark
+        @incomplete
+        @failed
+        @retry_failed
+        @counts
+        @save
+    """
+
+    INCOMPLETE_STATES: tuple[MigrationState, ...] = ("pending", "matched")
+
+    def __init__(self, *, name: str):
+        self.__file_path = get_config_path() / f".{name}_queue.json"
+        self.items: list[MigrationItem] = []
+        self.head = 0
+        self.__positions: dict[str, int] = {}
+        self.reload()
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__positions
+
+    def reload(self) -> None:
+        try:
+            with open(self.__file_path, "r") as file:
+                state = load(file)
+        except (FileNotFoundError, JSONDecodeError):
+            return
+
+        self.items = [
+            MigrationItem(
+                key=item["key"],
+                state=item["state"],
+                video=YTVideoInfo(**item["video"]) if item.get("video") else None,
+                error=item.get("error"),
+            )
+            for item in state.get("items", [])
+        ]
+        self.__positions = {item.key: index for index, item in enumerate(self.items)}
+        self.head = min(int(state.get("head", 0)), len(self.items))
+
+    def save(self) -> None:
+        """Writes the queue to a temporary file, then swaps it in."""
+        temp_path = self.__file_path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as file:
+            dump(
+                {"head": self.head, "items": [asdict(item) for item in self.items]},
+                file,
+            )
+
+        replace(temp_path, self.__file_path)
+
+    def extend(self, items: Iterable[MigrationItem]) -> int:
+        """
+        Appends the items whose key is not queued yet.
+
+        Returns:
+            int: The number of items appended.
+        """
+        appended = 0
+        for item in items:
+            if item.key in self.__positions:
+                continue
+
+            self.__positions[item.key] = len(self.items)
+            self.items.append(item)
+            appended += 1
+
+        self._advance()
+        return appended
+
+    def get(self, key: str) -> Optional[MigrationItem]:
+        position = self.__positions.get(key)
+        return self.items[position] if position is not None else None
+
+    def mark(
+        self,
+        key: str,
+        state: MigrationState,
+        *,
+        video: Optional[YTVideoInfo] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """Moves the item of `key` to `state`."""
+        item = self.items[self.__positions[key]]
+        item.state = state
+        item.video = video or item.video
+        item.error = error
+
+        self._advance()
+
+    def _advance(self) -> None:
+        while (
+            self.head < len(self.items)
+            and self.items[self.head].state not in self.INCOMPLETE_STATES
+        ):
+            self.head += 1
+
+    def incomplete(self) -> Iterator[MigrationItem]:
+        """Yields the pending and matched items, from the head of the queue."""
+        for index in range(self.head, len(self.items)):
+            item = self.items[index]
+            if item.state in self.INCOMPLETE_STATES:
+                yield item
+
+    def failed(self) -> list[MigrationItem]:
+        return [item for item in self.items if item.state == "failed"]
+
+    def retry_failed(self) -> int:
+        """
+        Puts the failed items back in the queue.
+
+        Returns:
+            int: The number of items to retry.
+        """
+        retried = 0
+        for index, item in enumerate(self.items):
+            if item.state != "failed":
+                continue
+
+            item.state = "pending"
+            item.error = None
+            self.head = min(self.head, index)
+            retried += 1
+
+        return retried
+
+    def counts(self) -> Counter:
+        """Number of items in each state."""
+        return Counter(item.state for item in self.items)
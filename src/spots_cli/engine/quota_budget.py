@@ -0,0 +1,89 @@
+from datetime import datetime
+from json import JSONDecodeError, dump, load
+from logging import getLogger
+from typing import Literal
+from zoneinfo import ZoneInfo
+
+from spots_cli.utils import get_config_path
+
+logger = getLogger(__name__)
+
+QuotaOperation = Literal["list", "rate", "search"]
+
+
+class QuotaBudget:
+    """
+    Tracks the YouTube Data API units spent today, persisted across runs.
+
+    The daily quota resets at midnight Pacific time, so usage is kept per
+    Pacific calendar day.
+
+    Methods:
+        @remaining
+        @affordable
+        @spend
+        @exhaust
+        @save
+    """
+
+    # units charged by the YouTube Data API per call
+    UNIT_COSTS: dict[QuotaOperation, int] = {"list": 1, "rate": 50, "search": 100}
+
+    DEFAULT_DAILY_LIMIT = 10_000
+
+    TIMEZONE = ZoneInfo("America/Los_Angeles")
+
+    def __init__(self, *, daily_limit: int = DEFAULT_DAILY_LIMIT):
+        self.daily_limit = daily_limit
+        self.__file_path = get_config_path() / ".youtube_quota.json"
+        self._day = self.today()
+        self._used = 0
+        self.reload()
+
+    def today(self) -> str:
+        return datetime.now(self.TIMEZONE).date().isoformat()
+
+    def reload(self) -> None:
+        """Reads today's usage, a file from an earlier day counts as unused."""
+        try:
+            with open(self.__file_path, "r") as file:
+                state = load(file)
+        except (FileNotFoundError, JSONDecodeError):
+            return
+
+        if state.get("day") == self._day:
+            self._used = int(state.get("used", 0))
+
+    def _roll_over(self) -> None:
+        today = self.today()
+        if today != self._day:
+            logger.debug("[Quota] New quota day %s", today)
+            self._day = today
+            self._used = 0
+
+    @property
+    def used(self) -> int:
+        self._roll_over()
+        return self._used
+
+    def remaining(self) -> int:
+        """Units left for today."""
+        return max(self.daily_limit - self.used, 0)
+
+    def affordable(self, operation: QuotaOperation) -> int:
+        """How many `operation` calls fit in what is left of today's budget."""
+        return self.remaining() // self.UNIT_COSTS[operation]
+
+    def spend(self, operation: QuotaOperation, count: int = 1) -> None:
+        """Records `count` calls of `operation`."""
+        self._roll_over()
+        self._used += self.UNIT_COSTS[operation] * count
+
+    def exhaust(self) -> None:
+        """Marks today's budget as used, when the API reports it exceeded."""
+        self._roll_over()
+        self._used = max(self._used, self.daily_limit)
+
+    def save(self) -> None:
+        with open(self.__file_path, "w") as file:
+            dump({"day": self._day, "used": self._used}, file)
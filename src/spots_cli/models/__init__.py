@@ -15,10 +15,13 @@ from spots_cli.models.helper_models import (
     SearchResponseSingle,
     SearchResponseMultiple,
 )
+from spots_cli.models.lyrics_record import LyricsRecord
 from spots_cli.models.media_resource import MediaResourceSingle, MediaResourcePlaylist
 from spots_cli.models.metadata import Metadata
 from spots_cli.models.metadata_provider import MetadataProvider
 from spots_cli.models.playlist_info import PlaylistInfo
+from spots_cli.models.playlist_snapshot import PlaylistSnapshot
 from spots_cli.models.search_provider import SearchProvider, ArtistInfo
+from spots_cli.models.search_record import SearchRecord
 from spots_cli.models.sentinel import Sentinel
 from spots_cli.models.yt_video_info import YTVideoInfo
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class LyricsRecord:
+    """A cached lyrics lookup
+
+    Args:
+        lyrics (str): the lyrics of the song. An empty string if none were found.
+        fetched_at (float): the unix timestamp of the lookup.
+    """
+
+    lyrics: str
+    fetched_at: float
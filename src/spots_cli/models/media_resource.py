@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Literal, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from spots_cli.models import PlaylistInfo, YTVideoInfo, Metadata
+    from spots_cli.models import PlaylistInfo, PlaylistSnapshot, YTVideoInfo, Metadata
 
 
 @dataclass
@@ -18,3 +18,8 @@ class MediaResourceSingle:
 class MediaResourcePlaylist:
     resource_type: Literal["playlist"]
     playlist_info: PlaylistInfo
+    # set when syncing, saved once the playlist is downloaded
+    snapshot: PlaylistSnapshot | None = None
+    removed_track_ids: list[str] = field(default_factory=list)
+    # the tracks to download, synced once they are
+    pending_track_ids: list[str] = field(default_factory=list)
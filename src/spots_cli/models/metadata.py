@@ -12,11 +12,12 @@ class Metadata:
         cover (str, optional): the url for the cover image. Defaults to ""
         tracknumber (str, optional): the song's position in an album. `position/album_length`. Defaults to ""
         album (str, optional): the album name. Defaults to ""
-        lyrics (str, optional): the lyrics of the song. Defaults to ""
+        lyrics (str, optional): the lyrics of the song. Resolved lazily when the song is tagged. Defaults to ""
         release_date (str | None, optional): the release date of the song. Defaults to None.
         preview_url (str | None, optional): A link to a 30 second preview (MP3 format) of the track. Defaults to None.
         artist_cover (str | None, optional): The artist's cover image. Defauls to None.
         artist_id (str): The artist's id.
+        duration (int | None, optional): The length of the song in seconds. Defaults to None.
     """
 
     title: str
@@ -30,6 +31,7 @@ class Metadata:
     release_date: str | None = None
     preview_url: str | None = None
     artist_cover: str | None = None
+    duration: int | None = None
 
     @property
     def full_title(self):
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, overload, Any
+from logging import getLogger
+from typing import TYPE_CHECKING, Iterable, overload, Any
+
+from spots_cli.models.errors import SongNotFound
 
 if TYPE_CHECKING:
     from spots_cli.models import Metadata
     from spots_cli.bootstrap.container import Core, Clients
 
 
+logger = getLogger(__name__)
+
+
 class MetadataProvider(ABC):
 
     @abstractmethod
@@ -50,3 +56,26 @@ class MetadataProvider(ABC):
             MetadataNotFound: if metadata not found for id.
         """
         pass
+
+    def get_many(self, track_ids: Iterable[str]) -> list[Metadata]:
+        """
+        Retrieves metadata for several tracks.
+
+        Providers with a bulk endpoint should override this. The default
+        implementation looks each track up individually.
+
+        Arguments:
+            track_ids (Iterable[str]): the track ids to retrieve data for.
+
+        Returns:
+            list[Metadata]: the metadata of every track found, in the order of `track_ids`.
+        """
+        metadata_list: list[Metadata] = []
+
+        for track_id in track_ids:
+            try:
+                metadata_list.append(self.get(track_id=track_id))
+            except SongNotFound as e:
+                logger.debug(e)
+
+        return metadata_list
@@ -18,6 +18,7 @@ class PlaylistInfo:
         artist (str, Optional): The artist of the playlist (if album). Defaults to None.
         provider_metadata (list[Metadata]): A list of provider metadata for the playlist.
         youtube_metadata (list[YTVideoInfo]): A list youtube metadata for the playlist.
+        snapshot_id (str, Optional): The provider's version of the playlist, if it has one. Defaults to None.
     """
 
     name: str
@@ -25,3 +26,4 @@ class PlaylistInfo:
     provider_metadata: list[Metadata]
     youtube_metadata: list[YTVideoInfo]
     artist: str | None = None
+    snapshot_id: str | None = None
@@ -0,0 +1,20 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass
+class PlaylistSnapshot:
+    """
+    The tracks of a playlist when it was last synced.
+
+    Args:
+        url (str): The playlist url.
+        name (str): The playlist's name.
+        snapshot_id (str, Optional): The provider's version of the playlist, if it has one. Defaults to None.
+        track_ids (list[str]): The provider links, or YouTube video ids, of the tracks.
+    """
+
+    url: str
+    name: str
+    snapshot_id: Optional[str] = None
+    track_ids: list[str] = field(default_factory=list)
@@ -44,6 +44,10 @@ class SearchProvider(ABC):
     def search_playlist(self, playlist_url: str) -> PlaylistInfo:
         pass
 
+    def playlist_snapshot(self, playlist_url: str) -> str | None:
+        """The provider's current version of a playlist, None if it has none."""
+        return None
+
     @abstractmethod
     def search_album(self, album_url: str) -> PlaylistInfo:
         pass
@@ -0,0 +1,16 @@
+from dataclasses import dataclass, field
+
+from spots_cli.models.yt_video_info import YTVideoInfo
+
+
+@dataclass
+class SearchRecord:
+    """A cached search listing
+
+    Args:
+        fetched_at (float): the unix timestamp of the search.
+        results (list[YTVideoInfo]): the listed videos. Empty if there were none.
+    """
+
+    fetched_at: float
+    results: list[YTVideoInfo] = field(default_factory=list)
@@ -13,7 +13,11 @@ class YTVideoInfo:
     title: str
     uploader: str
     audio_ext: str
-    filesize: int
+    # in MB, None when the search listing didn't resolve the formats
+    filesize: int | None
+    duration: int | None = None
+    channel_id: str | None = None
+    view_count: int | None = None
 
     @property
     def video_link(self):
@@ -1,45 +1,34 @@
 """Recursively adds user's downloaded songs to spots history file"""
 
-from mutagen.id3 import ID3
-from mutagen.mp3 import MP3, HeaderNotFoundError
-from os import listdir, path, getcwd
+from os import path
 
-from spots_cli.utils import get_config_path
-
-history_file = get_config_path() / ".spots_download_history.txt"
-
-
-def update_history(file_path):
-    """Update history file with song information"""
-    try:
-        song = MP3(file_path, ID3)
-        artist = song.get("TPE1", "")
-        artist = f"{artist} - " if artist else ""
-        title = song.get("TIT2", "")
-        song_name = f"{artist}{title}"
-        if title:
-            with open(history_file, "a", newline="") as history:
-                history.write(f"{song_name}\n")
-    except (HeaderNotFoundError, KeyError):
-        pass
-
-
-def process_directory(directory):
-    """Process all MP3 files in a directory"""
-    for item in listdir(directory):
-        item_path = path.join(directory, item)
-        if path.isdir(item_path):
-            process_directory(item_path)  # Recursively process subdirectories
-        elif item_path.lower().endswith(".mp3"):
-            update_history(item_path)
+from spots_cli.core import HistoryManager, LibraryScanner
+from spots_cli.engine import LibraryEntry, LibraryIndex
 
 
 def main(folder):
     if path.exists(folder):
         print("Updating Spots downloads history...")
 
-        process_directory(folder)
-
-        print("Spots downloads history updated!")
+        # only files added or changed since the last run have their tags read
+        files = LibraryScanner().scan(folder)
+        added = HistoryManager().write_many(
+            file.song_name for file in files if file.title
+        )
+        library = LibraryIndex()
+        library.add_many(
+            LibraryEntry(artist=file.artist, title=file.title, path=file.path)
+            for file in files
+        )
+
+        # songs deleted since they were indexed aren't owned anymore
+        scanned = {file.path for file in files}
+        library.remove_paths(
+            indexed
+            for indexed in library.paths_under(path.abspath(folder))
+            if indexed not in scanned
+        )
+
+        print(f"Spots downloads history updated! {added} songs added.")
     else:
         print("Folder not found.")
@@ -1,54 +1,33 @@
 """Removes all duplicate mp3 files"""
 
-from os import listdir, path, getcwd, remove
-from sys import argv
-from mutagen.id3 import ID3
-from mutagen.mp3 import MP3, HeaderNotFoundError
+from os import path
 
-original_songs: dict[str, str] = {}
+from spots_cli.core import DuplicateFinder
+from spots_cli.core.library_scanner import TRASH_DIR
+from spots_cli.engine import LibraryIndex
 
-i = 0
 
-
-def process_song(file_path: str):
-    """Removes a song if it is a duplicate"""
-    try:
-        song = MP3(file_path, ID3)
-        artist = song.get("TPE1", "")
-        artist = f"{artist} - " if artist else ""
-        title = song.get("TIT2", "")
-        song_name = f"{artist}{title}"
-
-        original = original_songs.get(song_name)
-        if original:
-            remove(file_path)
-        else:
-            original_songs[song_name] = file_path
-    except (HeaderNotFoundError, KeyError):
-        pass
-
-
-def process_directory(directory: str):
-    """Process all MP3 files in a directory"""
-    contents = listdir(directory)
-    contents.sort(reverse=True)
-
-    for item in contents:
-        print(f"[{globals()['i']}] Scanning: {item}")
-        globals()["i"] += 1
-        item_path = path.join(directory, item)
-        if path.isdir(item_path):
-            process_directory(item_path)  # Recursively process subdirectories
-        elif item_path.lower().endswith(".mp3"):
-            process_song(item_path)
-
-
-def main(folder: str):
+def main(folder: str, *, delete: bool = False, dry_run: bool = False):
     if path.exists(folder):
         print("Searching for duplicate songs...")
 
-        process_directory(folder)
+        finder = DuplicateFinder()
+        groups = finder.find(folder)
+
+        for group in groups:
+            print(f"Keeping: {group.keeper.path}")
+            for duplicate in group.duplicates:
+                print(f"    duplicate: {duplicate.path}")
 
-        print("Duplicate songs removed!")
+        removed = finder.remove(groups, folder=folder, delete=delete, dry_run=dry_run)
+        if not dry_run:
+            LibraryIndex().remove_paths(removed)
+
+        if dry_run:
+            print(f"{len(removed)} duplicate songs found, nothing removed (dry run).")
+        elif delete:
+            print(f"{len(removed)} duplicate songs deleted!")
+        else:
+            print(f"{len(removed)} duplicate songs moved to {path.join(folder, TRASH_DIR)}!")
     else:
         print("Folder not found.")
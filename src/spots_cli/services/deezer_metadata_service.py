@@ -84,13 +84,6 @@ class DeezerMetadataService(MetadataProvider):
         artist_name = artist_info["name"]
         track_name = track["title"]
 
-        # get track lyrics
-        try:
-            lyrics = self.core.lyrics.get_lyrics(title=track_name, artist=artist_name)
-        except Exception as e:
-            logger.error(f"Error occurred while searching for lyrics", e)
-            lyrics = ""
-
         metadata = Metadata(
             title=track_name,
             artist=artist_name,
@@ -98,11 +91,11 @@ class DeezerMetadataService(MetadataProvider):
             release_date=track["release_date"],
             tracknumber=str(track["track_position"]),
             cover=cover,
-            lyrics=lyrics,
             album=album_name,
             preview_url=track["preview"],
             artist_cover=artist_info["picture"],
             artist_id=artist_info["id"],
+            duration=track.get("duration"),
         )
         self.core.storage.new(query=url, result=metadata, query_type="metadata")
         return metadata
@@ -69,8 +69,14 @@ class DeezerSearchService(SearchProvider):
             cover=playlist_data["picture"],
             provider_metadata=playlist_metadata,
             youtube_metadata=[],
+            snapshot_id=playlist_data.get("checksum"),
         )
 
+    def playlist_snapshot(self, playlist_url: str) -> str | None:
+        # the checksum comes with the playlist, its tracks aren't looked up
+        playlist_data = self.clients.deezer._get_resource_by_url(playlist_url)
+        return playlist_data.get("checksum")
+
     def search_artist(self, artist_query: str) -> ArtistInfo:
         # deezer provides a list of search results
         # so we use the first result
@@ -88,9 +94,9 @@ class DeezerSearchService(SearchProvider):
         artist_info, top_tracks = self.clients.deezer.artist_top_tracks(artist_id_int)
 
         # get metadata for each top track
-        top_tracks_playlist = [
-            self.metadata.get(track_id=top_track["id"]) for top_track in top_tracks
-        ]
+        top_tracks_playlist = self.metadata.get_many(
+            str(top_track["id"]) for top_track in top_tracks
+        )
 
         return PlaylistInfo(
             cover=artist_info.cover,
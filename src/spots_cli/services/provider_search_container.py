@@ -16,7 +16,7 @@ class ProviderSearchContainer:
             "deezer": (DeezerSearchService, True),  # always available
             "spotify": (
                 SpotifySearchService,
-                bool(clients.spotify),  # availability check
+                clients.spotify_available,  # read from secrets, client stays unbuilt
             ),
         }
 
@@ -2,10 +2,8 @@ from __future__ import annotations
 
 from datetime import datetime
 from logging import getLogger
-from spotipy.exceptions import SpotifyException
-from typing import Any, overload, TYPE_CHECKING
+from typing import Any, Callable, Iterable, overload, TYPE_CHECKING
 
-from spots_cli.engine import storage
 from spots_cli.models import (
     SongNotFound,
     Metadata,
@@ -15,6 +13,7 @@ from spots_cli.models import (
 )
 
 if TYPE_CHECKING:
+    from spotipy import Spotify
     from spots_cli.bootstrap.container import Core, Clients
     from spots_cli.clients import SpotifyClient
 
@@ -23,6 +22,9 @@ logger = getLogger(__name__)
 
 
 class SpotifyMetadataService(MetadataProvider):
+    TRACK_URL = "https://open.spotify.com/track/"
+    TRACKS_CHUNK_SIZE = 50
+
     def __init__(
         self,
         *,
@@ -57,14 +59,14 @@ class SpotifyMetadataService(MetadataProvider):
 
         if track_id is not None:
             query_id = track_id
-        if search_result is not None:
+        elif search_result is not None:
             query_id = search_result["id"]
         else:
             raise ValueError("Either track_id or search_result must be provided")
 
         # check cache first
-        url = "https://open.spotify.com/track/" + query_id
-        cache = storage.get(query=url, query_type="metadata")
+        url = self.TRACK_URL + query_id
+        cache = self.core.storage.get(query=url, query_type="metadata")
         if isinstance(cache, Sentinel):
             raise SongNotFound(query_id)
         elif isinstance(cache, Metadata):
@@ -72,29 +74,95 @@ class SpotifyMetadataService(MetadataProvider):
 
         # search song if id provided
         if track_id is not None:
-            try:
-                # retrieve track from spotify
-                track = self._spotify().client.track(track_id)
-
-            except SpotifyException as e:
-                if e.http_status == 401:
-                    if "Invalid access token" in e.msg:
-                        raise RuntimeError("Authentication Failed") from e
-                    else:
-                        self._spotify().signin()
-                        track = self._spotify().client.track(track_id)
-                else:
-                    logger.error(
-                        f"Unexpected error occurred when retrieving Spotify metadata"
-                    )
-                    raise RuntimeError("Unhandled error in get") from e
+            track = self._request(lambda client: client.track(track_id))
 
             if not track:
-                storage.new(query=url, result=Sentinel(), query_type="metadata")
+                self.core.storage.new(
+                    query=url, result=Sentinel(), query_type="metadata"
+                )
                 raise SongNotFound(f"Spotify id: {track_id}")
         elif search_result is not None:
             track = search_result
 
+        metadata = self._build_metadata(track)
+        self.core.storage.new(query=url, result=metadata, query_type="metadata")
+
+        return metadata
+
+    def get_many(self, track_ids: Iterable[str]) -> list[Metadata]:
+        """
+        Retrieves metadata for several tracks using the Spotify several-tracks endpoint.
+
+        The cache is checked for the whole batch first, then the missing tracks
+        are requested in chunks of `TRACKS_CHUNK_SIZE`.
+
+        Args:
+            track_ids (Iterable[str]): The Spotify track ids.
+
+        Returns:
+            list[Metadata]: the metadata of every track found, in the order of `track_ids`.
+        """
+        track_ids = list(dict.fromkeys(track_ids))
+        resolved: dict[str, Metadata] = {}
+        missing: list[str] = []
+
+        for track_id in track_ids:
+            try:
+                cache = self.core.storage.get(
+                    query=self.TRACK_URL + track_id, query_type="metadata"
+                )
+            except SongNotFound:
+                continue
+
+            if isinstance(cache, Metadata):
+                resolved[track_id] = cache
+            else:
+                missing.append(track_id)
+
+        logger.debug(
+            f"Spotify metadata: {len(resolved)} cached, {len(missing)} to retrieve"
+        )
+
+        for start in range(0, len(missing), self.TRACKS_CHUNK_SIZE):
+            chunk = missing[start : start + self.TRACKS_CHUNK_SIZE]
+            result = self._request(lambda client: client.tracks(chunk))
+            tracks = result["tracks"] if result else []
+
+            for track_id, track in zip(chunk, tracks):
+                url = self.TRACK_URL + track_id
+
+                if not track:
+                    self.core.storage.new(
+                        query=url, result=Sentinel(), query_type="metadata"
+                    )
+                    continue
+
+                metadata = self._build_metadata(track)
+                self.core.storage.new(query=url, result=metadata, query_type="metadata")
+                resolved[track_id] = metadata
+
+        return [resolved[track_id] for track_id in track_ids if track_id in resolved]
+
+    def _request(self, request: Callable[[Spotify], Any]) -> Any:
+        """Runs a Spotify API request, signing in again if the session expired."""
+        from spotipy.exceptions import SpotifyException
+
+        try:
+            return request(self._spotify().client)
+        except SpotifyException as e:
+            if e.http_status == 401:
+                if "Invalid access token" in e.msg:
+                    raise RuntimeError("Authentication Failed") from e
+                else:
+                    self._spotify().signin()
+                    return request(self._spotify().client)
+            else:
+                logger.error(
+                    f"Unexpected error occurred when retrieving Spotify metadata"
+                )
+                raise RuntimeError("Unhandled error in get") from e
+
+    def _build_metadata(self, track: dict[str, Any]) -> Metadata:
         album = track["album"]
 
         # get track number
@@ -129,13 +197,10 @@ class SpotifyMetadataService(MetadataProvider):
         track_url = track["external_urls"]["spotify"]
         album_name = album["name"]
 
-        # get track lyrics
-        lyrics = self.core.lyrics.get_lyrics(title=track_name, artist=artist)
-
         preview_url = track["preview_url"] or ""
 
         first_artist = track["artists"][0]
-        metadata = Metadata(
+        return Metadata(
             track_name,
             artist_id=first_artist["id"],
             artist=artist,
@@ -143,9 +208,7 @@ class SpotifyMetadataService(MetadataProvider):
             cover=cover,
             tracknumber=track_number,
             album=album_name,
-            lyrics=lyrics,
             release_date=release_date,
             preview_url=preview_url,
+            duration=track["duration_ms"] // 1000,
         )
-
-        return metadata
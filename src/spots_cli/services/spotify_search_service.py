@@ -1,8 +1,9 @@
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
 from re import escape, search
 from tenacity import stop_after_delay
-from typing import Any, TYPE_CHECKING
+from typing import Any, Iterator, TYPE_CHECKING
 
 from spots_cli.engine import retry
 from spots_cli.models import (
@@ -27,6 +28,9 @@ logger = getLogger(__name__)
 
 
 class SpotifySearchService(SearchProvider):
+    ALBUM_URL = "https://open.spotify.com/album/"
+    PAGE_WORKERS = 4
+
     def __init__(
         self,
         *,
@@ -82,9 +86,9 @@ class SpotifySearchService(SearchProvider):
         if not top_tracks_search:
             raise SongNotFound(artist_id)
 
-        # get metadata for each top track
+        # top tracks are full track objects, no extra lookups needed
         top_tracks_playlist = [
-            self.metadata.get(track_id=top_track["id"])
+            self.metadata.get(search_result=top_track)
             for top_track in top_tracks_search["tracks"]
         ]
 
@@ -102,12 +106,19 @@ class SpotifySearchService(SearchProvider):
         if not playlist_result:
             raise SongNotFound(playlist_url)
 
-        # get playlist tracks
-        playlist_tracks: list[dict[str, Any]] = playlist_result["tracks"]["items"]
+        # build metadata page by page while the next pages are fetched
+        playlist_metadata: list[Metadata] = []
+        for playlist_items in self._playlist_pages(
+            playlist_url, first_page=playlist_result["tracks"]
+        ):
+            for item in playlist_items:
+                track = item.get("track")
 
-        playlist_metadata = [
-            self.metadata.get(search_result=track) for track in playlist_tracks
-        ]
+                # skip removed tracks, local files and podcast episodes
+                if not track or not track.get("id") or track.get("type") != "track":
+                    continue
+
+                playlist_metadata.append(self.metadata.get(search_result=track))
 
         cover = playlist_result["images"][0]["url"]
         playlist_name = playlist_result["name"]
@@ -119,34 +130,93 @@ class SpotifySearchService(SearchProvider):
             name=playlist_name,
             provider_metadata=playlist_metadata,
             youtube_metadata=[],
+            snapshot_id=playlist_result.get("snapshot_id"),
         )
 
+    def playlist_snapshot(self, playlist_url: str) -> str | None:
+        # only the version is requested, not the tracks
+        playlist_result = self._spotify().playlist(playlist_url, fields="snapshot_id")
+        return playlist_result.get("snapshot_id") if playlist_result else None
+
+    def _playlist_pages(
+        self, playlist_url: str, *, first_page: dict[str, Any]
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Yields every page of playlist items, in playlist order.
+
+        The remaining pages are requested concurrently as soon as the first page
+        reveals the playlist length, so later pages are usually ready by the
+        time the caller has processed the earlier ones.
+
+        Args:
+            playlist_url (str): The Spotify playlist url or id.
+            first_page (dict[str, Any]): The `tracks` page embedded in the playlist object.
+        """
+        yield first_page["items"]
+
+        if not first_page.get("next"):
+            return
+
+        limit = first_page["limit"]
+        offsets = range(first_page["offset"] + limit, first_page["total"], limit)
+        logger.debug(f"Prefetching {len(offsets)} more playlist pages...")
+
+        def fetch_page(offset: int) -> dict[str, Any] | None:
+            return self._spotify().playlist_items(
+                playlist_url, offset=offset, limit=limit, additional_types=("track",)
+            )
+
+        with ThreadPoolExecutor(max_workers=self.PAGE_WORKERS) as executor:
+            for page in executor.map(fetch_page, offsets):
+                if page:
+                    yield page["items"]
+
     def search_album(self, album_url: str) -> PlaylistInfo:
-        album_result = self._spotify().album(album_url)
+        album_id = album_url.split("/")[-1].split("?")[0]
+        cache_key = self.ALBUM_URL + album_id
+
+        cache = self.core.storage.get(query=cache_key, query_type="album")
+        if isinstance(cache, PlaylistInfo):
+            return cache
+
+        album_result = self._spotify().album(album_id)
         if not album_result:
+            self.core.storage.new(
+                query=cache_key, result=Sentinel(), query_type="album"
+            )
             raise SongNotFound(album_url)
 
         # artists
         artist_list = [artist["name"] for artist in album_result["artists"]]
 
-        # get album tracks
-        playlist_tracks: list[dict[str, Any]] = album_result["tracks"]["items"]
+        # get album tracks, following `next` pages for long albums
+        tracks_page = album_result["tracks"]
+        playlist_tracks: list[dict[str, Any]] = list(tracks_page["items"])
+        while tracks_page and tracks_page.get("next"):
+            tracks_page = self._spotify().next(tracks_page)
+            if tracks_page:
+                playlist_tracks.extend(tracks_page["items"])
 
+        # album tracks are simplified objects without the album they belong to
         playlist_metadata = [
-            self.metadata.get(search_result=track) for track in playlist_tracks
+            self.metadata.get(search_result={**track, "album": album_result})
+            for track in playlist_tracks
         ]
 
         cover = album_result["images"][0]["url"]
         album_name = album_result["name"]
         artist = ", ".join(artist_list)
 
-        return PlaylistInfo(
+        album_info = PlaylistInfo(
             cover=cover,
             artist=artist,
             name=album_name,
             provider_metadata=playlist_metadata,
             youtube_metadata=[],
         )
+        self.core.storage.new(query=cache_key, result=album_info, query_type="album")
+
+        return album_info
 
     @retry(stop=stop_after_delay(60))
     def search_track(self, query: str) -> Metadata:
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
 from logging import getLogger
 from math import ceil
+from time import time
 from tenacity import stop_after_delay
 from typing import Any, Literal, cast, overload, TYPE_CHECKING
 
@@ -11,13 +14,16 @@ from spots_cli.models import (
     SearchResponseSingle,
     SearchResponseMultiple,
     PlaylistInfo,
+    SearchRecord,
     Sentinel,
     YTVideoInfo,
 )
+from spots_cli.core.youtube_extractor import normalize_special_chars
 
 if TYPE_CHECKING:
     from yt_dlp import _Params
     from spots_cli.bootstrap.container import Clients, Core
+    from spots_cli.models import Metadata
 
 
 logger = getLogger(__name__)
@@ -26,13 +32,48 @@ logger = getLogger(__name__)
 class YoutubeSearchService:
     """Responsible for searching for query on YouTube"""
 
+    # progressive search: the query is searched wider until a result matches,
+    # then rephrased. Most tracks match the top result, wider stages only score
+    # the results the narrower ones didn't list
+    SEARCH_WIDTHS = (1, 5, 10)
+    QUERY_VARIANTS = ("{artist} - {title} audio", "{title} {artist} topic")
+    VARIANT_WIDTH = 5
+    # search listings are searched again after a week
+    SEARCH_TTL = 7 * 24 * 60 * 60
+
+    # artist search
+    ARTIST_SEARCH_WIDTH = 50
+    ARTIST_WORKERS = 4
+
     def __init__(self, *, clients: Clients, core: Core):
         self.clients = clients
         self.core = core
 
-    def get_video_size(self, data: dict[str, Any]) -> int:
+    def get_video_size(self, data: dict[str, Any]) -> int | None:
         size = data.get("filesize") or data.get("filesize_approx")
-        return ceil(size / (1024 * 1024)) if size else 0
+        return ceil(size / (1024 * 1024)) if size else None
+
+    def get_video_duration(self, data: dict[str, Any]) -> int | None:
+        duration = data.get("duration")
+        return round(duration) if duration else None
+
+    def to_video_info(self, data: dict[str, Any]) -> YTVideoInfo:
+        """
+        Builds a YTVideoInfo from a yt-dlp info dict or flat entry.
+
+        Flat entries carry no format data: filesize is left out and the audio
+        extension defaults to webm until the download resolves the actual format.
+        """
+        return YTVideoInfo(
+            id=data["id"],
+            title=data["title"],
+            uploader=data.get("uploader") or data.get("channel") or "",
+            filesize=self.get_video_size(data),
+            audio_ext=data.get("audio_ext", "webm"),
+            duration=self.get_video_duration(data),
+            channel_id=data.get("channel_id"),
+            view_count=data.get("view_count"),
+        )
 
     def youtube_playlist_search(self, link: str) -> PlaylistInfo:
         playlist_opts: _Params = {
@@ -49,6 +90,8 @@ class YoutubeSearchService:
         except Exception as e:
             logger.error(str(e))
             raise
+        finally:
+            self.clients.ytdlp.reset_options()
 
         if not playlist_search:
             raise SongNotFound(link)
@@ -58,18 +101,9 @@ class YoutubeSearchService:
         playlist_cover = "youtube-playlist(mdesigns).jpg"
 
         videos_list = [
-            YTVideoInfo(
-                title=result["title"],
-                uploader=result["uploader"],
-                filesize=self.get_video_size(result),
-                audio_ext=result["audio_ext"],
-                id=result["id"],
-            )
-            for result in playlist_search["entries"]
+            self.to_video_info(result) for result in playlist_search["entries"]
         ]
 
-        self.clients.ytdlp.reset_options()
-
         return PlaylistInfo(
             name=playlist_name,
             cover=playlist_cover,
@@ -101,10 +135,16 @@ class YoutubeSearchService:
                 else SearchResponseMultiple(result=[cache], is_cached=True)
             )
         else:
-            search_term = f"ytsearch5:{query}" if is_general_search else query
-            search_result = self.clients.ytdlp.client.extract_info(
-                search_term, download=False
-            )
+            # candidates only need titles to be matched, formats are resolved
+            # for the chosen video when it is downloaded
+            if is_general_search:
+                search_result = self.clients.ytdlp.flat_client.extract_info(
+                    f"ytsearch5:{query}", download=False
+                )
+            else:
+                search_result = self.clients.ytdlp.client.extract_info(
+                    query, download=False
+                )
 
             if not search_result:
                 self.core.storage.new(
@@ -123,89 +163,212 @@ class YoutubeSearchService:
             if not is_general_search:
 
                 return SearchResponseSingle(
-                    result=YTVideoInfo(
-                        title=search_result["title"],
-                        uploader=search_result["uploader"],
-                        id=search_result["id"],
-                        filesize=self.get_video_size(search_result),
-                        audio_ext=search_result.get("audio_ext", "webm"),
-                    ),
+                    result=self.to_video_info(search_result),
                     is_cached=False,
                 )
             else:
-                result_objects: list[YTVideoInfo] = []
-                for result in search_result["entries"]:
-                    result_objects.append(
-                        YTVideoInfo(
-                            title=result["title"],
-                            uploader=result["uploader"],
-                            id=result["id"],
-                            filesize=self.get_video_size(result),
-                            audio_ext=result.get("audio_ext", "webm"),
-                        )
-                    )
+                result_objects = [
+                    self.to_video_info(result) for result in search_result["entries"]
+                ]
 
                 return SearchResponseMultiple(result=result_objects, is_cached=False)
 
-    def artist_search(self, artist: str):
+    def search_stages(self, metadata: Metadata) -> list[tuple[str, int]]:
+        """The (search term, number of results) pairs tried in turn for a track."""
+        stages = [(metadata.full_title, width) for width in self.SEARCH_WIDTHS]
+        stages += [
+            (
+                variant.format(artist=metadata.artist, title=metadata.title),
+                self.VARIANT_WIDTH,
+            )
+            for variant in self.QUERY_VARIANTS
+        ]
+        return stages
+
+    @retry(stop=stop_after_delay(60))
+    def search_stage(self, *, term: str, width: int) -> list[YTVideoInfo]:
         """
-        Search for for all videos by an artist name on youtube
+        Lists the first `width` results for `term`, cached per stage for `SEARCH_TTL`.
+
+        A listing of the same term at least as wide, cached by another stage, is
+        reused instead of searching again.
+
+        Returns:
+            list[YTVideoInfo]: The results, empty if there are none.
+        """
+        key = f"ytsearch{width}:{term}"
+
+        widths = {width, self.VARIANT_WIDTH, *self.SEARCH_WIDTHS}
+        for cached_width in sorted(w for w in widths if w >= width):
+            cache = self.core.storage.get(
+                query=f"ytsearch{cached_width}:{term}", query_type="search"
+            )
+            if cache and time() - cache.fetched_at < self.SEARCH_TTL:
+                return cache.results[:width]
+
+        search_result = self.clients.ytdlp.flat_client.extract_info(key, download=False)
+        entries = cast(dict[str, Any], search_result or {}).get("entries") or []
+        results = [self.to_video_info(entry) for entry in entries]
+
+        self.core.storage.new(
+            query=key,
+            result=SearchRecord(fetched_at=time(), results=results),
+            query_type="search",
+        )
+        return results
+
+    def match_track(self, metadata: Metadata) -> YTVideoInfo:
+        """
+        Finds the YouTube video of a track, searching progressively.
+
+        Starts with the top result only, widens the search while no result
+        matches, then tries rephrased queries. Results already evaluated in an
+        earlier stage are not scored again.
 
         Args:
-            artist (str): The name of the artist
-            default_cover (str): Fallback cover url
+            metadata (Metadata): The track to find.
 
         Returns:
-            List[Metadata]: A list of songs by `artist` found on YT
+            YTVideoInfo: The matching video.
+
+        Raises:
+            SongNotFound: if no stage returns a matching video.
         """
-        logger.info(f"[Search Artist on YouTube] Searching for {artist}'s songs on YT")
+        query = metadata.full_title
 
-        ydl_opts: _Params = {
-            "quiet": True,
-            "extract_flat": True,
-        }
+        cache = self.core.storage.get(query=query, query_type="youtube")
+        if cache:
+            return cache
+
+        seen: set[str] = set()
+        for term, width in self.search_stages(metadata):
+            # results are matched on copies, extraction rewrites title and uploader
+            candidates = [
+                replace(result)
+                for result in self.search_stage(term=term, width=width)
+                if result.id not in seen
+            ]
+            if not candidates:
+                continue
+
+            seen.update(candidate.id for candidate in candidates)
+            logger.debug(
+                "Matching %d new results for '%s' (ytsearch%d)",
+                len(candidates),
+                term,
+                width,
+            )
+
+            best_match = self.core.matcher.select_best_match(
+                search_results=candidates, metadata=metadata
+            )
+            if best_match:
+                self.core.storage.new(
+                    query=query, result=best_match, query_type="youtube"
+                )
+                return best_match
+
+        logger.warning("No match found for query: '%s'", query)
+        self.core.storage.new(query=query, result=Sentinel(), query_type="youtube")
+        raise SongNotFound(query)
+
+    def artist_search(self, artist: str) -> list[YTVideoInfo]:
+        """
+        Search for for all videos by an artist on youtube
+
+        Lists the videos once without extracting them, keeps one video per
+        normalized title, and only looks up the details of entries the listing
+        left incomplete, concurrently. Videos already cached for the artist are
+        reused, so an interrupted search resumes where it stopped.
 
-        self.clients.ytdlp.options = ydl_opts
-        search_results = self.clients.ytdlp.client.extract_info(artist, download=False)
+        Args:
+            artist (str): The name of the artist, or the url of their channel
+
+        Returns:
+            list[YTVideoInfo]: A list of songs by `artist` found on YT
+        """
+        logger.info(f"[Search Artist on YouTube] Searching for {artist}'s songs on YT")
+
+        search_term = (
+            artist
+            if artist.startswith("http")
+            else f"ytsearch{self.ARTIST_SEARCH_WIDTH}:{artist}"
+        )
+        search_results = self.clients.ytdlp.flat_client.extract_info(
+            search_term, download=False
+        )
 
         if not search_results:
             raise SongNotFound(artist)
 
-        video_record: dict[str, YTVideoInfo] = {}
-
         search_results = cast(dict[str, Any], search_results)
 
-        playlist_len = len(search_results["entries"])
-        for index, entry in enumerate(search_results["entries"]):
-            logger.info(
-                f"[Search Artist on YouTube] Searching for track {index + 1}/{playlist_len} on YouTube..."
-            )
-            title = entry.get("title")
+        cached = {
+            video.id: video
+            for video in self.core.storage.get(query=artist, query_type="artist") or []
+            if isinstance(video, YTVideoInfo)
+        }
 
-            if not video_record.get(title):
-                try:
-                    id = entry.get("id")
-                    watch_url = f"https://www.youtube.com/watch?v={id}"
-                    metadata = self.video_search(
-                        query=watch_url, is_general_search=False
-                    )
-                    video_record[title] = metadata.result
+        # one entry per normalized title
+        entries: dict[str, dict[str, Any]] = {}
+        for entry in search_results.get("entries") or []:
+            if not entry or not entry.get("id") or not entry.get("title"):
+                continue
+            entries.setdefault(normalize_special_chars(entry["title"]), entry)
+
+        videos: dict[str, YTVideoInfo] = {}
+        incomplete: list[str] = []
+        for entry in entries.values():
+            video_id = entry["id"]
+            if video_id in cached:
+                videos[video_id] = cached[video_id]
+            elif entry.get("uploader") or entry.get("channel"):
+                videos[video_id] = self.to_video_info(entry)
+            else:
+                incomplete.append(video_id)
+
+        for video in videos.values():
+            if video.id not in cached:
+                self.core.storage.new(query=artist, result=video, query_type="artist")
+
+        logger.info(
+            f"[Search Artist on YouTube] {len(videos)} videos listed, "
+            f"looking up {len(incomplete)} more..."
+        )
 
-                    if (index % 10 == 0) or (index == (playlist_len - 1)):
-                        self.core.storage.save()
+        with ThreadPoolExecutor(max_workers=self.ARTIST_WORKERS) as executor:
+            futures = [
+                executor.submit(self._video_details, video_id)
+                for video_id in incomplete
+            ]
 
-                except SongNotFound:
+            for future in as_completed(futures):
+                video = future.result()
+                if video is None:
                     continue
-            else:
-                continue
 
-            self.clients.ytdlp.reset_options()
+                videos[video.id] = video
+                self.core.storage.new(query=artist, result=video, query_type="artist")
 
-            artist_playlist = list(video_record.values())
-            self.core.storage.new(
-                query=artist, result=artist_playlist, query_type="artist"
+        self.core.storage.save()
+
+        # listing order
+        return [
+            videos[entry["id"]] for entry in entries.values() if entry["id"] in videos
+        ]
+
+    def _video_details(self, video_id: str) -> YTVideoInfo | None:
+        watch_url = f"https://www.youtube.com/watch?v={video_id}"
+
+        try:
+            result = self.clients.ytdlp.thread_client.extract_info(
+                watch_url, download=False
             )
+        except Exception as e:
+            logger.debug(f"[Search Artist on YouTube] Skipping {watch_url}: {e}")
+            return None
 
-            self.core.storage.save()
+        if not result:
+            return None
 
-            return artist_playlist
+        return self.to_video_info(cast(dict[str, Any], result))